@@ -5,8 +5,10 @@ Configuration validator for foundry-pipeline-assistant.
 Helps users validate their Azure AI setup and environment configuration.
 """
 
+import importlib.metadata
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -41,22 +43,30 @@ def check_env_file():
         'AZURE_OPENAI_DEPLOYMENT_NAME': 'GPT model deployment name'
     }
     
-    all_configured = True
+    placeholders = {
+        'your-api-key-here',
+        'your-foundry-resource.services.ai.azure.com/api/projects/your-project',
+        'your-gpt-deployment-name'
+    }
+    
+    # Classify all required variables against a single environment snapshot
+    env = dict(os.environ)
+    missing = required_vars.keys() - {var for var, value in env.items() if value}
+    placeheld = {var for var in required_vars.keys() - missing if env[var] in placeholders}
     
     for var, description in required_vars.items():
-        value = os.getenv(var)
-        if not value:
+        if var in missing:
             print(f"❌ {var} not set")
-            all_configured = False
-        elif value in ['your-api-key-here', 'your-foundry-resource.services.ai.azure.com/api/projects/your-project', 'your-gpt-deployment-name']:
+        elif var in placeheld:
             print(f"⚠️  {var} contains placeholder value")
             print(f"   Please update with your actual {description}")
-            all_configured = False
         else:
             print(f"✅ {var} configured")
     
+    all_configured = not (missing or placeheld)
+    
     # Check optional variables
-    api_version = os.getenv('AZURE_API_VERSION', '2024-02-01')
+    api_version = env.get('AZURE_API_VERSION', '2024-02-01')
     print(f"ℹ️  AZURE_API_VERSION: {api_version} (using default)")
     
     return all_configured
@@ -85,6 +95,26 @@ def test_azure_connection():
         return False
 
 
+def check_package_installed():
+    """Check that the foundry-pipeline-assistant distribution is installed."""
+    try:
+        importlib.metadata.distribution('foundry-pipeline-assistant')
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+
+def _probe_module(module_name):
+    """Check that a module can be found and imported, returning (ok, error)."""
+    try:
+        if find_spec(module_name) is None:
+            return False, "module not found"
+        __import__(module_name)
+        return True, None
+    except ImportError as e:
+        return False, str(e)
+
+
 def test_service_imports():
     """Test that all service modules can be imported."""
     print("\n📦 Testing service imports...")
@@ -101,11 +131,11 @@ def test_service_imports():
     all_imported = True
     
     for module_name, description in services_to_test:
-        try:
-            __import__(module_name)
+        imported, error = _probe_module(module_name)
+        if imported:
             print(f"✅ {description}")
-        except ImportError as e:
-            print(f"❌ {description}: {e}")
+        else:
+            print(f"❌ {description}: {error}")
             all_imported = False
     
     return all_imported
@@ -133,6 +163,9 @@ def main():
     
     if not imports_ok:
         print("\n❌ Service imports failed - check package installation")
+        # A source checkout works without installing, so this is only a hint
+        if not check_package_installed():
+            print("   foundry-pipeline-assistant package is not installed")
         print("   Run: pip install -e '.[dev]'")
         sys.exit(1)
     
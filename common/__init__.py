@@ -1,12 +1,27 @@
 """
 Common utilities for the foundry-pipeline-assistant project.
-"""
 
-from .azure_ai import llm_text, llm_json, AzureAIClient, ensure_json
+Public names are resolved lazily (PEP 562) so that importing a submodule of
+``common`` does not pull in the Azure AI client and its HTTP dependencies.
+"""
 
 __all__ = [
     "llm_text",
-    "llm_json", 
+    "llm_json",
     "AzureAIClient",
     "ensure_json",
-]
\ No newline at end of file
+    "load_env",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import azure_ai
+        value = getattr(azure_ai, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
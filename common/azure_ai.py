@@ -5,12 +5,18 @@ This module provides a framework-free client for Azure OpenAI services
 with support for JSON and text responses, automatic retries, and proper error handling.
 """
 
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
 import os
 import re
+import threading
 import time
-from typing import Any, Dict, Optional, cast
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, cast
 
 import httpx
 from dotenv import load_dotenv
@@ -18,18 +24,86 @@ from dotenv import load_dotenv
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Azure AI Projects SDK imports for assistant functionality
+# Azure AI Projects SDK symbols for assistant functionality. The SDK pulls in a
+# large dependency tree, so it is only imported on first use (see _load_azure_sdk).
+AZURE_AI_SDK_AVAILABLE: Optional[bool] = None
+AIProjectClient: Any = None
+DefaultAzureCredential: Any = None
+ListSortOrder: Any = None
+
+
+def _load_azure_sdk() -> bool:
+    """
+    Import the Azure AI Projects SDK on first use and cache the result.
+    
+    Returns:
+        True if the SDK is importable, False otherwise
+    """
+    global AZURE_AI_SDK_AVAILABLE, AIProjectClient, DefaultAzureCredential, ListSortOrder
+    if AZURE_AI_SDK_AVAILABLE is not None:
+        return AZURE_AI_SDK_AVAILABLE
+    
+    try:
+        from azure.ai.projects import AIProjectClient
+        from azure.identity import DefaultAzureCredential
+        from azure.ai.agents.models import ListSortOrder
+        AZURE_AI_SDK_AVAILABLE = True
+    except ImportError:
+        AZURE_AI_SDK_AVAILABLE = False
+        logger.warning("Azure AI Projects SDK not available. Assistant functionality will use HTTP fallback.")
+    return AZURE_AI_SDK_AVAILABLE
+
+
+# Environment variables read by AzureAIClient when not passed explicitly
+_ENV_KEYS = (
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_OPENAI_DEPLOYMENT_NAME",
+    "AZURE_API_VERSION",
+    "AZURE_ASSISTANT_ID",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load the .env file into the process environment exactly once.
+    
+    Call this before reading configuration from os.environ outside of
+    AzureAIClient, which loads the file itself.
+    
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv(override=False)
+
+
+# orjson parses response bytes directly and is noticeably faster; it is optional
 try:
-    from azure.ai.projects import AIProjectClient
-    from azure.identity import DefaultAzureCredential
-    from azure.ai.agents.models import ListSortOrder
-    AZURE_AI_SDK_AVAILABLE = True
+    import orjson
 except ImportError:
-    AZURE_AI_SDK_AVAILABLE = False
-    logger.warning("Azure AI Projects SDK not available. Assistant functionality will use HTTP fallback.")
+    orjson = None
+
 
-# Load environment variables
-load_dotenv()
+def _loads(content: bytes) -> Any:
+    """Parse a JSON HTTP response body without decoding it to str first."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a JSON request body to bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Markdown code fence around a JSON payload, e.g. ```json { ... } ```
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
 
 
 class AzureAIError(Exception):
@@ -70,11 +144,17 @@ def ensure_json(response_text: str) -> Dict[str, Any]:
     # Strip markdown code fences if present
     cleaned_text = response_text.strip()
     
-    # Remove ```json and ``` markers
-    json_pattern = r"```(?:json)?\s*(.*?)\s*```"
-    match = re.search(json_pattern, cleaned_text, re.DOTALL)
-    if match:
-        cleaned_text = match.group(1).strip()
+    # Remove ```json and ``` markers. A response that is exactly one fenced block
+    # is unwrapped with plain string operations; the regex is only needed when the
+    # fences are embedded in surrounding text.
+    if "```" in cleaned_text:
+        inner = cleaned_text.removeprefix("```").removesuffix("```")
+        if len(inner) == len(cleaned_text) - 6 and "```" not in inner:
+            cleaned_text = inner.removeprefix("json").strip()
+        else:
+            match = _FENCE_RE.search(cleaned_text)
+            if match:
+                cleaned_text = match.group(1).strip()
     
     # Try to parse JSON
     try:
@@ -83,6 +163,11 @@ def ensure_json(response_text: str) -> Dict[str, Any]:
         raise JSONParseError(f"Failed to parse JSON from response: {e}\nResponse text: {cleaned_text}")
 
 
+def _close_client(client: httpx.Client) -> None:
+    """Close an HTTP client; used as the AzureAIClient finalizer."""
+    client.close()
+
+
 class AzureAIClient:
     """
     Azure AI Foundry client for both direct chat completions and assistant interactions.
@@ -98,7 +183,9 @@ class AzureAIClient:
                  assistant_id: Optional[str] = None,
                  timeout: float = 30.0,
                  max_retries: int = 3,
-                 retry_delay: float = 1.0):
+                 retry_delay: float = 1.0,
+                 cache_enabled: bool = True,
+                 cache_size: int = 128):
         """
         Initialize Azure AI client.
         
@@ -111,22 +198,25 @@ class AzureAIClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             retry_delay: Base delay between retries in seconds
+            cache_enabled: Reuse responses for identical chat completion requests
+            cache_size: Maximum number of cached responses (least recently used are evicted)
         """
         # Get configuration from parameters or environment variables
-        endpoint = endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
-        api_key = api_key or os.getenv("AZURE_OPENAI_API_KEY")
-        deployment = deployment or os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-        api_version = api_version or os.getenv("AZURE_API_VERSION", "2024-02-01")
-        assistant_id = assistant_id or os.getenv("AZURE_ASSISTANT_ID")
+        load_env()
+        env = {key: os.environ.get(key) for key in _ENV_KEYS}
+        endpoint = endpoint or env["AZURE_OPENAI_ENDPOINT"]
+        api_key = api_key or env["AZURE_OPENAI_API_KEY"]
+        deployment = deployment or env["AZURE_OPENAI_DEPLOYMENT_NAME"]
+        api_version = api_version or env["AZURE_API_VERSION"] or "2024-02-01"
+        assistant_id = assistant_id or env["AZURE_ASSISTANT_ID"]
         
         # Validate required configuration
-        missing_vars = []
-        if not endpoint:
-            missing_vars.append("AZURE_OPENAI_ENDPOINT")
-        if not api_key:
-            missing_vars.append("AZURE_OPENAI_API_KEY")  
-        if not deployment:
-            missing_vars.append("AZURE_OPENAI_DEPLOYMENT_NAME")
+        required = {
+            "AZURE_OPENAI_ENDPOINT": endpoint,
+            "AZURE_OPENAI_API_KEY": api_key,
+            "AZURE_OPENAI_DEPLOYMENT_NAME": deployment,
+        }
+        missing_vars = [name for name, value in required.items() if not value]
         
         if missing_vars:
             missing_list = ", ".join(missing_vars)
@@ -154,18 +244,49 @@ class AzureAIClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         
-        # Build the API URL (safe after validation above)
+        # Fixed chat completion parameters, merged into every request payload
+        self._default_payload_base = {
+            "max_tokens": 4000,
+            "top_p": 0.95,
+            "frequency_penalty": 0,
+            "presence_penalty": 0
+        }
+        
+        # Response cache for chat completions, keyed by a digest of the request
+        self.cache_enabled = cache_enabled
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Build the API URLs (safe after validation above)
+        self._base = f"{self.endpoint.rstrip('/')}/openai"
+        self._api_version_query = f"?api-version={self.api_version}"
         self.api_url = (
-            f"{cast(str, self.endpoint).rstrip('/')}/openai/deployments/{self.deployment}"
-            f"/chat/completions?api-version={self.api_version}"
+            f"{self._base}/deployments/{self.deployment}/chat/completions{self._api_version_query}"
+        )
+        self._threads_runs_url = f"{self._base}/threads/runs{self._api_version_query}"
+        
+        # Create a pooled HTTP client with timeout; auth headers are sent on every request
+        self.client = httpx.Client(
+            timeout=httpx.Timeout(timeout),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=30.0
+            ),
+            headers={
+                "Content-Type": "application/json",
+                "api-key": self.api_key
+            }
         )
         
-        # Create HTTP client with timeout
-        self.client = httpx.Client(timeout=httpx.Timeout(timeout))
+        # Close the HTTP client when this instance is garbage collected
+        self._finalizer = weakref.finalize(self, _close_client, self.client)
         
         # Initialize Azure AI Projects client for assistant functionality
         self.ai_project_client = None
-        if self.assistant_id and AZURE_AI_SDK_AVAILABLE:
+        if self.assistant_id and _load_azure_sdk():
             try:
                 self.ai_project_client = AIProjectClient(
                     credential=DefaultAzureCredential(),
@@ -176,17 +297,18 @@ class AzureAIClient:
                 logger.warning(f"Failed to initialize Azure AI Projects client: {e}. Will use HTTP fallback.")
                 self.ai_project_client = None
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        return {
-            "Content-Type": "application/json",
-            "api-key": cast(str, self.api_key)
-        }
+    @staticmethod
+    def _cache_key(body: bytes) -> str:
+        """Build a content-addressed cache key from a serialized request body."""
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
     
     def _make_request(self, messages: list, temperature: float = 0.1) -> str:
         """
         Make a request to Azure OpenAI API with retries.
         
+        Identical requests are answered from the response cache when
+        ``cache_enabled`` is set.
+        
         Args:
             messages: List of message objects for the chat completion
             temperature: Sampling temperature (0.0 to 1.0)
@@ -199,19 +321,22 @@ class AzureAIClient:
             AzureAITimeoutError: For timeout errors
             AzureAIRateLimitError: For rate limiting errors
         """
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": self.api_key
-        }
-        
         payload = {
+            **self._default_payload_base,
             "messages": messages,
-            "temperature": temperature,
-            "max_tokens": 4000,
-            "top_p": 0.95,
-            "frequency_penalty": 0,
-            "presence_penalty": 0
+            "temperature": temperature
         }
+        # Serialized once: reused as the cache key and on every retry attempt
+        body = _dumps(payload)
+        
+        cache_key = None
+        if self.cache_enabled:
+            cache_key = self._cache_key(body)
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    return cached
         
         last_exception = None
         
@@ -219,14 +344,19 @@ class AzureAIClient:
             try:
                 response = self.client.post(
                     self.api_url,
-                    json=payload,
-                    headers=headers
+                    content=body
                 )
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _loads(response.content)
                     if "choices" in data and len(data["choices"]) > 0:
-                        return data["choices"][0]["message"]["content"]
+                        content = data["choices"][0]["message"]["content"]
+                        if cache_key is not None:
+                            with self._cache_lock:
+                                self._cache[cache_key] = content
+                                if len(self._cache) > self.cache_size:
+                                    self._cache.popitem(last=False)
+                        return content
                     else:
                         raise AzureAIError("No choices in response")
                 
@@ -346,14 +476,14 @@ Respond with valid JSON that matches the expected structure."""
     
     def _run_assistant_with_sdk(self, user_prompt: str, system_prompt: Optional[str] = None) -> str:
         """Run assistant using Azure AI Projects SDK."""
-        if not self.ai_project_client:
+        if not self.ai_project_client or not _load_azure_sdk():
             raise AzureAIError("AI Project client not initialized")
         
         # Create thread
         thread = self.ai_project_client.agents.threads.create()
         
         # Create message
-        message = self.ai_project_client.agents.messages.create(
+        self.ai_project_client.agents.messages.create(
             thread_id=thread.id,
             role="user",
             content=user_prompt
@@ -369,14 +499,17 @@ Respond with valid JSON that matches the expected structure."""
         if run.status == "failed":
             raise AzureAIError(f"Assistant run failed: {run.last_error}")
         
-        # Get messages
+        return self._latest_assistant_text_with_sdk(thread.id)
+    
+    def _latest_assistant_text_with_sdk(self, thread_id: str) -> str:
+        """Return the newest assistant message on a thread using the SDK."""
+        # Newest first, so iteration stops at the first page in practice
         messages = self.ai_project_client.agents.messages.list(
-            thread_id=thread.id, 
-            order=ListSortOrder.ASCENDING if AZURE_AI_SDK_AVAILABLE else None
+            thread_id=thread_id,
+            order=ListSortOrder.DESCENDING
         )
         
-        # Find the latest assistant response
-        for message in reversed(list(messages)):
+        for message in messages:
             if message.role == "assistant" and message.text_messages:
                 return message.text_messages[-1].text.value
         
@@ -384,19 +517,13 @@ Respond with valid JSON that matches the expected structure."""
     
     def _run_assistant_with_http(self, user_prompt: str, system_prompt: Optional[str] = None) -> str:
         """Fallback HTTP implementation for assistant functionality."""
-        # Create a thread
-        thread_id = self._create_thread()
-        
         # Add system prompt as additional instructions if provided
         instructions = system_prompt if system_prompt else None
         
-        # Add user message
-        self._add_message(thread_id, user_prompt)
+        # Create the thread with the user message and start the run in one request
+        thread_id, run_id = self._create_thread_and_run(user_prompt, instructions)
         
-        # Run the assistant
-        response = self._run_assistant(thread_id, instructions)
-        
-        return response
+        return self._wait_for_run(thread_id, run_id)
     
     def llm_text_with_specific_assistant(self, user_prompt: str, assistant_id: str, system_prompt: Optional[str] = None) -> str:
         """
@@ -429,14 +556,14 @@ Respond with valid JSON that matches the expected structure."""
     
     def _run_specific_assistant_with_sdk(self, user_prompt: str, assistant_id: str, system_prompt: Optional[str] = None) -> str:
         """Run a specific assistant using Azure AI Projects SDK."""
-        if not self.ai_project_client:
+        if not self.ai_project_client or not _load_azure_sdk():
             raise AzureAIError("AI Project client not initialized")
         
         # Create thread
         thread = self.ai_project_client.agents.threads.create()
         
         # Create message
-        message = self.ai_project_client.agents.messages.create(
+        self.ai_project_client.agents.messages.create(
             thread_id=thread.id,
             role="user",
             content=user_prompt
@@ -452,131 +579,102 @@ Respond with valid JSON that matches the expected structure."""
         if run.status == "failed":
             raise AzureAIError(f"Assistant run failed: {run.last_error}")
         
-        # Get messages
-        messages = self.ai_project_client.agents.messages.list(
-            thread_id=thread.id, 
-            order=ListSortOrder.ASCENDING if AZURE_AI_SDK_AVAILABLE else None
-        )
-        
-        # Find the latest assistant response
-        for message in reversed(list(messages)):
-            if message.role == "assistant" and message.text_messages:
-                return message.text_messages[-1].text.value
-        
-        raise AzureAIError("No assistant response found")
+        return self._latest_assistant_text_with_sdk(thread.id)
     
-    def _create_thread(self) -> str:
-        """Create a new conversation thread."""
-        url = f"{cast(str, self.endpoint).rstrip('/')}/openai/threads?api-version={self.api_version}"
-        
-        response = self.client.post(
-            url,
-            headers=self._get_headers(),
-            json={}
-        )
-        
-        if response.status_code != 200:
-            raise AzureAIError(f"Thread creation failed: {response.status_code} - {response.text}")
-        
-        return response.json()["id"]
+    def _thread_messages_url(self, thread_id: str) -> str:
+        """URL for the messages of a thread."""
+        return f"{self._base}/threads/{thread_id}/messages{self._api_version_query}"
     
-    def _add_message(self, thread_id: str, content: str):
-        """Add a message to a thread."""
-        url = f"{cast(str, self.endpoint).rstrip('/')}/openai/threads/{thread_id}/messages?api-version={self.api_version}"
-        
-        response = self.client.post(
-            url,
-            headers=self._get_headers(),
-            json={
-                "role": "user",
-                "content": content
-            }
-        )
-        
-        if response.status_code != 200:
-            raise AzureAIError(f"Message creation failed: {response.status_code} - {response.text}")
+    def _thread_runs_url(self, thread_id: str, run_id: Optional[str] = None) -> str:
+        """URL for the runs of a thread, or for a single run when run_id is given."""
+        run_path = f"/{run_id}" if run_id else ""
+        return f"{self._base}/threads/{thread_id}/runs{run_path}{self._api_version_query}"
     
-    def _run_assistant(self, thread_id: str, additional_instructions: Optional[str] = None) -> str:
-        """Run the assistant on a thread and return the response."""
-        # Start the run
-        run_url = f"{cast(str, self.endpoint).rstrip('/')}/openai/threads/{thread_id}/runs?api-version={self.api_version}"
-        
-        run_data = {
-            "assistant_id": self.assistant_id
+    def _create_thread_and_run(self, content: str, additional_instructions: Optional[str] = None) -> Tuple[str, str]:
+        """Create a thread containing a user message and start a run on it, returning (thread_id, run_id)."""
+        url = self._threads_runs_url
+        
+        run_data: Dict[str, Any] = {
+            "assistant_id": self.assistant_id,
+            "thread": {
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": content
+                    }
+                ]
+            }
         }
         
         if additional_instructions:
             run_data["additional_instructions"] = additional_instructions
         
         response = self.client.post(
-            run_url,
-            headers=self._get_headers(),
+            url,
             json=run_data
         )
         
         if response.status_code != 200:
-            raise AzureAIError(f"Run creation failed: {response.status_code} - {response.text}")
-        
-        run_id = response.json()["id"]
-        
-        # Poll for completion
-        status_url = f"{cast(str, self.endpoint).rstrip('/')}/openai/threads/{thread_id}/runs/{run_id}?api-version={self.api_version}"
-        max_attempts = 30  # 30 seconds timeout
+            raise AzureAIError(f"Thread and run creation failed: {response.status_code} - {response.text}")
         
-        for _ in range(max_attempts):
-            status_response = self.client.get(status_url, headers=self._get_headers())
+        run = _loads(response.content)
+        return run["thread_id"], run["id"]
+    
+    def _wait_for_run(self, thread_id: str, run_id: str) -> str:
+        """Poll a run until it finishes and return the latest assistant message."""
+        status_url = self._thread_runs_url(thread_id, run_id)
+        deadline = time.monotonic() + 30.0  # 30 seconds timeout
+        delay = 0.1
+        
+        while True:
+            status_response = self.client.get(status_url)
             
             if status_response.status_code != 200:
                 raise AzureAIError(f"Run status check failed: {status_response.status_code}")
             
-            run_status = status_response.json()["status"]
+            run_status = _loads(status_response.content)["status"]
             
             if run_status == "completed":
                 # Get the messages
-                messages_url = f"{cast(str, self.endpoint).rstrip('/')}/openai/threads/{thread_id}/messages?api-version={self.api_version}"
-                messages_response = self.client.get(messages_url, headers=self._get_headers())
+                # Only the newest message is needed: the assistant's reply to this run
+                messages_url = self._thread_messages_url(thread_id)
+                messages_response = self.client.get(messages_url, params={"order": "desc", "limit": 1})
                 
                 if messages_response.status_code != 200:
                     raise AzureAIError(f"Messages retrieval failed: {messages_response.status_code}")
                 
-                messages = messages_response.json()["data"]
-                # Get the latest assistant message
-                for message in messages:
-                    if message["role"] == "assistant":
-                        return message["content"][0]["text"]["value"]
+                messages = _loads(messages_response.content)["data"]
+                if messages and messages[0]["role"] == "assistant":
+                    return messages[0]["content"][0]["text"]["value"]
                 
                 raise AzureAIError("No assistant response found")
             
             elif run_status in ["failed", "cancelled", "expired"]:
                 raise AzureAIError(f"Assistant run {run_status}")
             
-            # Wait before next check
-            import time
-            time.sleep(1)
+            # Back off before the next check, honouring a server-provided retry-after
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = float(status_response.headers.get("retry-after", delay))
+            time.sleep(min(wait, remaining))
+            delay = min(delay * 1.5, 2.0)
         
         raise AzureAIError("Assistant run timed out")
-    
-    def __del__(self):
-        """Clean up HTTP client on deletion."""
-        if hasattr(self, 'client'):
-            self.client.close()
-
-
-# Global client instance (lazy-initialized)
-_client: Optional[AzureAIClient] = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_client() -> AzureAIClient:
     """
     Get or create global Azure AI client instance.
     
+    The instance is created on first call and shared afterwards; use
+    ``get_client.cache_clear()`` to force a new client (e.g. in tests).
+    
     Returns:
         AzureAIClient instance
     """
-    global _client
-    if _client is None:
-        _client = AzureAIClient()
-    return _client
+    return AzureAIClient()
 
 
 def llm_text(system_prompt: str, user_prompt: str) -> str:
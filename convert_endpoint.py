@@ -6,9 +6,14 @@ Helps convert between Azure OpenAI and Azure AI Foundry endpoint formats.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
+_UTF8_BOM = b'\xef\xbb\xbf'
+_ENDPOINT_RE = re.compile(rb'(?m)^[ \t]*AZURE_OPENAI_ENDPOINT=(.*)$')
+
+
 def convert_endpoint_format():
     """Convert Azure OpenAI endpoint to Azure AI Foundry format."""
     
@@ -18,12 +23,12 @@ def convert_endpoint_format():
         print("❌ .env file not found")
         return False
     
-    current_endpoint = None
-    with open(env_file, 'r') as f:
-        for line in f:
-            if line.strip().startswith('AZURE_OPENAI_ENDPOINT='):
-                current_endpoint = line.split('=', 1)[1].strip()
-                break
+    # Read the file once; the same buffer is reused for the rewrite below
+    raw_data = env_file.read_bytes()
+    env_data = raw_data.removeprefix(_UTF8_BOM)
+    bom = raw_data[:len(raw_data) - len(env_data)]
+    match = _ENDPOINT_RE.search(env_data)
+    current_endpoint = match.group(1).strip().decode('utf-8') if match else None
     
     if not current_endpoint:
         print("❌ AZURE_OPENAI_ENDPOINT not found in .env")
@@ -55,14 +60,14 @@ def convert_endpoint_format():
         
         print(f"🎯 New endpoint: {new_endpoint}")
         
-        # Update .env file
-        env_content = env_file.read_text()
-        updated_content = env_content.replace(
-            f"AZURE_OPENAI_ENDPOINT={current_endpoint}",
-            f"AZURE_OPENAI_ENDPOINT={new_endpoint}"
-        )
+        # Update .env file by splicing the new value in at the matched offsets,
+        # keeping any surrounding whitespace (e.g. a CRLF line ending) intact
+        value = match.group(1)
+        start = match.start(1) + len(value) - len(value.lstrip())
+        end = match.end(1) - (len(value) - len(value.rstrip()))
+        updated_data = env_data[:start] + new_endpoint.encode('utf-8') + env_data[end:]
         
-        env_file.write_text(updated_content)
+        env_file.write_bytes(bom + updated_data)
         print("✅ Updated .env with Azure AI Foundry endpoint format")
         
         return True
@@ -6,25 +6,50 @@ Provides command-line interface for pipeline analysis with configurable
 questions and multiple output formats.
 """
 
-import json
 import logging
 import os
 import sys
+import traceback
 from pathlib import Path
 
 import click
 from dotenv import load_dotenv
 
+# YAML output is optional; fall back to JSON when PyYAML is not installed
+try:
+    import yaml
+    _HAS_YAML = True
+except ImportError:
+    yaml = None
+    _HAS_YAML = False
+
 # Load environment variables early
 load_dotenv()
 
-from services.orchestrator import run
+from services.orchestrator import run, to_json
+
+
+# Environment variables that must be set for Azure AI analysis
+_REQUIRED_VARS = ('AZURE_OPENAI_ENDPOINT', 'AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_DEPLOYMENT_NAME')
+
+
+def _write_output(data: bytes) -> None:
+    """Write a (potentially large) encoded result to stdout in a single write."""
+    stdout = click.get_text_stream('stdout')
+    buffer = getattr(stdout, 'buffer', None)
+    if buffer is None:
+        # Text-only streams (e.g. some embedded consoles) still go through click
+        click.echo(data.decode('utf-8'))
+        return
+    
+    stdout.flush()
+    buffer.write(data + b'\n')
+    buffer.flush()
 
 
 def validate_azure_config() -> None:
     """Validate Azure AI configuration before running analysis."""
-    required_vars = ['AZURE_OPENAI_ENDPOINT', 'AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_DEPLOYMENT_NAME']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [var for var in _REQUIRED_VARS if not os.getenv(var)]
     
     if missing_vars:
         missing_list = ", ".join(missing_vars)
@@ -84,17 +109,17 @@ def main(question: str, output: str, quiet: bool, verbose: bool) -> None:
             click.echo(f"📊 Analyzed {result['outputs']['report']['stats']['pipelines_total']} pipelines")
             click.echo(f"🔍 Found {result['outputs']['report']['stats']['errors_total']} total errors")
         
+        # Without PyYAML, YAML output falls back to the single JSON output path
+        if output == 'yaml' and not _HAS_YAML:
+            click.echo("❌ YAML output requires PyYAML. Install with: pip install PyYAML", err=True)
+            click.echo("Falling back to JSON output:", err=True)
+            output = 'json'
+        
         # Output results based on format
         if output == 'json':
-            click.echo(json.dumps(result, indent=2))
+            _write_output(to_json(result, indent=True))
         elif output == 'yaml':
-            try:
-                import yaml
-                click.echo(yaml.dump(result, default_flow_style=False))
-            except ImportError:
-                click.echo("❌ YAML output requires PyYAML. Install with: pip install PyYAML", err=True)
-                click.echo("Falling back to JSON output:", err=True)
-                click.echo(json.dumps(result, indent=2))
+            click.echo(yaml.dump(result, default_flow_style=False))
         elif output == 'markdown':
             # Output the markdown report
             click.echo(result['outputs']['report']['markdown'])
@@ -126,7 +151,6 @@ def main(question: str, output: str, quiet: bool, verbose: bool) -> None:
     except Exception as e:
         click.echo(f"❌ Error during analysis: {str(e)}", err=True)
         if verbose:
-            import traceback
             click.echo(traceback.format_exc(), err=True)
         sys.exit(1)
 
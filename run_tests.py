@@ -2,143 +2,46 @@
 """
 Simple test runner for foundry-pipeline-assistant tests.
 
-Runs the test suite without requiring pytest to be installed,
-demonstrating that all the core functionality works correctly.
+Runs the core service and workflow tests through pytest, so fixtures and
+parametrized cases behave exactly as in a full test run, and provides a
+quick smoke test of the core functionality.
 """
 
 import sys
 import traceback
-from typing import List, Tuple
 
-# Import the test classes
-from tests.test_services import TestBambooMockNormalization, TestLogsMockService
-from tests.test_orchestrator import TestOrchestratorEndToEnd, TestWorkflowSystemFunctions
+import pytest
 
-
-def run_test_method(test_class, method_name: str, test_instance=None) -> Tuple[bool, str]:
-    """Run a single test method and return success status and message."""
-    try:
-        if test_instance is None:
-            test_instance = test_class()
-        
-        # Get the method
-        method = getattr(test_instance, method_name)
-        
-        # Handle pytest fixtures by creating mock responses if needed
-        if method_name in ['test_orchestrator_run_success', 'test_orchestrator_result_structure',
-                          'test_final_report_json_keys', 'test_markdown_content_assertions',
-                          'test_statistics_calculations', 'test_pipeline_processing_traceability',
-                          'test_execution_summary', 'test_deterministic_results']:
-            # These tests need the mock_llm_responses fixture
-            mock_responses = {
-                'json_response': {
-                    "pipeline_key": "PROJ-PLAN1",
-                    "summary": "Pipeline shows excellent health with 100% success rate",
-                    "top_errors": [],
-                    "recommendations": ["Continue monitoring pipeline performance"]
-                },
-                'text_response': "# CI/CD Pipeline Report\n\n## Executive Summary\n\nExcellent health across 3 pipelines with 87.5% success rate.\n\n| Metric | Value |\n|--------|-------|\n| Total Pipelines | 3 |\n| Average Duration | 542 seconds (9 minutes) |\n\nCritical issues requiring attention..."
-            }
-            
-            # Mock the LLM calls and run the method
-            from unittest.mock import patch
-            
-            with patch('services.analyzer_agent.llm_json') as mock_json, \
-                 patch('services.reporting_agent.llm_text') as mock_text:
-                mock_json.return_value = mock_responses['json_response']
-                mock_text.return_value = mock_responses['text_response']
-                method(mock_text, mock_json, mock_responses)
-        else:
-            # Regular test method
-            method()
-        
-        return True, "PASSED"
-        
-    except Exception as e:
-        error_msg = f"FAILED: {str(e)}"
-        return False, error_msg
+# Core tests run by the suite, as pytest node ids
+CORE_TESTS = [
+    # Service tests
+    *(f"tests/test_services.py::TestBambooMockNormalization::{name}" for name in (
+        'test_get_bamboo_plans_structure',
+        'test_normalize_bamboo_plans_deterministic_ordering',
+        'test_normalize_bamboo_plans_structure',
+        'test_normalize_bamboo_plans_specific_content'
+    )),
+    *(f"tests/test_services.py::TestLogsMockService::{name}" for name in (
+        'test_get_pipeline_logs_deterministic',
+        'test_get_pipeline_logs_structure',
+        'test_get_pipeline_logs_errors_structure',
+        'test_get_all_logs_with_plans',
+        'test_get_error_summary_statistics',
+        'test_get_error_summary_no_errors',
+        'test_pipeline_specific_content',
+        'test_unknown_pipeline_handling'
+    )),
+    # Orchestrator tests (limited set to avoid complex mocking)
+    "tests/test_orchestrator.py::TestWorkflowSystemFunctions::test_get_workflow_status",
+]
 
 
 def run_test_suite() -> None:
-    """Run the complete test suite."""
+    """Run the core test suite and exit with pytest's status code."""
     print("🧪 Running Foundry Pipeline Assistant Test Suite")
     print("=" * 60)
     
-    # Define test cases
-    test_cases = [
-        # Service tests
-        (TestBambooMockNormalization, [
-            'test_get_bamboo_plans_structure',
-            'test_normalize_bamboo_plans_deterministic_ordering',
-            'test_normalize_bamboo_plans_structure',
-            'test_normalize_bamboo_plans_specific_content'
-        ]),
-        (TestLogsMockService, [
-            'test_get_pipeline_logs_deterministic',
-            'test_get_pipeline_logs_structure', 
-            'test_get_pipeline_logs_errors_structure',
-            'test_get_all_logs_with_plans',
-            'test_get_error_summary_statistics',
-            'test_get_error_summary_no_errors',
-            'test_pipeline_specific_content',
-            'test_unknown_pipeline_handling'
-        ]),
-        # Orchestrator tests (limited set to avoid complex mocking)
-        (TestWorkflowSystemFunctions, [
-            'test_get_workflow_status'
-        ])
-    ]
-    
-    total_tests = 0
-    passed_tests = 0
-    failed_tests: List[str] = []
-    
-    for test_class, test_methods in test_cases:
-        class_name = test_class.__name__
-        print(f"\n📋 {class_name}")
-        print("-" * 40)
-        
-        test_instance = test_class()
-        
-        for method_name in test_methods:
-            total_tests += 1
-            success, message = run_test_method(test_class, method_name, test_instance)
-            
-            status_icon = "✅" if success else "❌"
-            print(f"  {status_icon} {method_name}: {message}")
-            
-            if success:
-                passed_tests += 1
-            else:
-                failed_tests.append(f"{class_name}::{method_name}")
-    
-    # Summary
-    print("\n" + "=" * 60)
-    print("🎯 TEST SUMMARY")
-    print("=" * 60)
-    print(f"Total Tests: {total_tests}")
-    print(f"Passed: {passed_tests} ✅")
-    print(f"Failed: {len(failed_tests)} ❌")
-    
-    if failed_tests:
-        print(f"\n💥 Failed Tests:")
-        for test in failed_tests:
-            print(f"  - {test}")
-    
-    success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-    print(f"\nSuccess Rate: {success_rate:.1f}%")
-    
-    if success_rate >= 90:
-        print("🎉 Excellent! Test suite is healthy.")
-        return_code = 0
-    elif success_rate >= 75:
-        print("🟡 Good, but some tests need attention.")
-        return_code = 1
-    else:
-        print("🔴 Test suite needs significant fixes.")
-        return_code = 1
-    
-    sys.exit(return_code)
+    sys.exit(pytest.main(["-v", *CORE_TESTS]))
 
 
 def quick_smoke_test() -> None:
@@ -4,24 +4,35 @@ Services module for the foundry-pipeline-assistant project.
 Contains mock services and external API integrations.
 """
 
-from .bamboo_mock import get_bamboo_plans, get_plan_results
-from .logs_mock import get_pipeline_logs, get_all_logs, get_error_summary
+from .bamboo_mock import (
+    Plan, get_bamboo_plans, get_bamboo_plans_objects, list_plan_keys, list_enabled_plan_keys, get_plan,
+    get_plan_results
+)
+from .logs_mock import ErrorDetail, get_pipeline_logs, get_all_logs, get_error_summary, iter_error_details
 from .analyzer_agent import analyze_pipeline_logs, analyze_multiple_pipelines, get_fleet_summary
 from .reporting_agent import aggregate_and_report, generate_daily_summary
-from .orchestrator import run, get_workflow_status, run_quick_health_check
+from .orchestrator import run, to_json, get_workflow_status, run_quick_health_check
 
 __all__ = [
+    "Plan",
     "get_bamboo_plans",
+    "get_bamboo_plans_objects",
+    "list_plan_keys",
+    "list_enabled_plan_keys",
+    "get_plan",
     "get_plan_results",
+    "ErrorDetail",
     "get_pipeline_logs",
     "get_all_logs", 
     "get_error_summary",
+    "iter_error_details",
     "analyze_pipeline_logs",
     "analyze_multiple_pipelines",
     "get_fleet_summary",
     "aggregate_and_report",
     "generate_daily_summary",
     "run",
+    "to_json",
     "get_workflow_status",
     "run_quick_health_check",
 ]
\ No newline at end of file
@@ -7,11 +7,82 @@ to heuristic analysis if the LLM service is unavailable.
 
 import json
 import os
-from typing import Dict, List, Any
+import re
+from typing import Dict, Iterator, List, Any
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from common.azure_ai import llm_json, get_client, AzureAIError
 
+# Upper bound on concurrent LLM requests in analyze_multiple_pipelines
+_MAX_CONCURRENT_ANALYSES = 8
+
+# Markdown fence markers around JSON in assistant responses
+_JSON_FENCE_OPEN = '```json'
+_JSON_FENCE_CLOSE = '```'
+
+# System prompt for senior CI engineer persona
+_SYSTEM_PROMPT = """You are a senior CI/CD engineer with 10+ years of experience analyzing Bamboo pipeline logs. 
+Your expertise includes identifying failure patterns, performance bottlenecks, and providing actionable recommendations 
+for improving pipeline reliability and efficiency.
+
+Analyze the provided pipeline log data and provide insights that would help a development team optimize their CI/CD process."""
+
+# User prompt template; filled with the pipeline name, key and JSON log digest
+_USER_TEMPLATE = """Analyze the following summary of Bamboo pipeline logs for {name} ({key}):
+
+{payload}
+
+Please provide a comprehensive analysis focusing on:
+1. Overall pipeline health and performance trends
+2. Error patterns and their frequency
+3. Specific actionable recommendations for improvement
+4. Any performance or reliability concerns
+
+Consider the success/failure rates, error types, duration patterns, and any recurring issues."""
+
+# Explicit JSON schema for the response
+_SCHEMA_HINT = """{
+  "pipeline_key": "string - the pipeline identifier",
+  "summary": "string - concise 2-3 sentence overview of pipeline health and key findings",
+  "top_errors": [
+    {
+      "message": "string - clear description of the error or issue",
+      "count": "integer - number of times this error occurred"
+    }
+  ],
+  "recommendations": [
+    "string - specific actionable recommendation for improvement"
+  ]
+}"""
+
+# Health keywords for fleet scoring: single words are matched as whole tokens,
+# multi-word phrases as substrings of the lowercased summary
+_HEALTHY_WORDS = frozenset({'excellent', 'good'})
+_HEALTHY_PHRASES = ('performing well', 'consistent success')
+_UNHEALTHY_WORDS = frozenset({'poor', 'concerning', 'failures'})
+_UNHEALTHY_PHRASES = ('requires attention',)
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Error keywords used for heuristic recommendations, found in a single scan.
+# The lookahead makes matches zero-width so overlapping keywords are all seen.
+_ERROR_PATTERN_RE = re.compile(
+    r'(?=(?P<timeout>timeout)|(?P<test>test)|(?P<failed>failed)|(?P<network>connection|network))',
+    re.IGNORECASE
+)
+
+# Assistants have no JSON mode, so the schema is appended to the user prompt
+_ASSISTANT_RESPONSE_FORMAT = "\n\nPlease respond with valid JSON in this exact format:\n" + _SCHEMA_HINT
+
+
+def _normalize_error(error: Any) -> Dict[str, Any]:
+    """Coerce an LLM-reported error entry into {message, count} form."""
+    if isinstance(error, dict):
+        return {'message': 'Unknown error', 'count': 1, **error}
+    if isinstance(error, str):
+        return {'message': error, 'count': 1}
+    return {'message': str(error), 'count': 1}
+
 
 def analyze_pipeline_logs(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -40,40 +111,13 @@ def analyze_pipeline_logs(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
     pipeline_key = pipeline_logs.get('pipeline_key', 'UNKNOWN')
     pipeline_name = pipeline_logs.get('pipeline_name', 'Unknown Pipeline')
     
-    # Prepare system prompt for senior CI engineer persona
-    system_prompt = """You are a senior CI/CD engineer with 10+ years of experience analyzing Bamboo pipeline logs. 
-Your expertise includes identifying failure patterns, performance bottlenecks, and providing actionable recommendations 
-for improving pipeline reliability and efficiency.
-
-Analyze the provided pipeline log data and provide insights that would help a development team optimize their CI/CD process."""
-    
-    # Create user prompt with pipeline data
-    user_prompt = f"""Analyze the following Bamboo pipeline logs for {pipeline_name} ({pipeline_key}):
-
-{json.dumps(pipeline_logs, indent=2)}
-
-Please provide a comprehensive analysis focusing on:
-1. Overall pipeline health and performance trends
-2. Error patterns and their frequency
-3. Specific actionable recommendations for improvement
-4. Any performance or reliability concerns
-
-Consider the success/failure rates, error types, duration patterns, and any recurring issues."""
-    
-    # Define explicit JSON schema for response
-    response_schema_hint = """{
-  "pipeline_key": "string - the pipeline identifier",
-  "summary": "string - concise 2-3 sentence overview of pipeline health and key findings",
-  "top_errors": [
-    {
-      "message": "string - clear description of the error or issue",
-      "count": "integer - number of times this error occurred"
-    }
-  ],
-  "recommendations": [
-    "string - specific actionable recommendation for improvement"
-  ]
-}"""
+    # Create user prompt with a compact digest of the pipeline data; the full logs
+    # (step output, commit hashes, timestamps) add tokens but little signal
+    user_prompt = _USER_TEMPLATE.format(
+        name=pipeline_name,
+        key=pipeline_key,
+        payload=json.dumps(_summarize_for_llm(pipeline_logs), separators=(',', ':'))
+    )
     
     try:
         # Get the Azure AI client
@@ -82,63 +126,41 @@ Consider the success/failure rates, error types, duration patterns, and any recu
         # Check if assistant is configured
         if client.assistant_id:
             # Use Azure AI Foundry assistant for analysis
-            full_prompt = f"""Analyze the following Bamboo pipeline logs for {pipeline_name} ({pipeline_key}):
-
-{json.dumps(pipeline_logs, indent=2)}
-
-Please provide a comprehensive analysis focusing on:
-1. Overall pipeline health and performance trends
-2. Error patterns and their frequency  
-3. Specific actionable recommendations for improvement
-4. Any performance or reliability concerns
-
-Consider the success/failure rates, error types, duration patterns, and any recurring issues.
-
-Please respond with valid JSON in this exact format:
-{response_schema_hint}"""
+            full_prompt = user_prompt + _ASSISTANT_RESPONSE_FORMAT
             
-            response_text = client.llm_text_with_assistant(full_prompt, system_prompt)
+            response_text = client.llm_text_with_assistant(full_prompt, _SYSTEM_PROMPT)
             
-            # Parse the JSON response
-            import re
-            # Extract JSON from response if it's wrapped in markdown
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1)
-            else:
+            # Parse the JSON response; bare JSON (the common case) is parsed directly
+            json_text = response_text.lstrip()
+            if not json_text.startswith('{'):
+                # Extract JSON from response if it's wrapped in markdown
                 json_text = response_text
+                start = response_text.find(_JSON_FENCE_OPEN)
+                if start >= 0:
+                    start += len(_JSON_FENCE_OPEN)
+                    end = response_text.find(_JSON_FENCE_CLOSE, start)
+                    if end >= 0:
+                        json_text = response_text[start:end].strip()
             
             analysis = json.loads(json_text)
         else:
             # Use traditional chat completions
-            analysis = llm_json(system_prompt, user_prompt, response_schema_hint)
+            analysis = llm_json(_SYSTEM_PROMPT, user_prompt, _SCHEMA_HINT)
         
         # Validate required keys are present
         required_keys = ['pipeline_key', 'summary', 'top_errors', 'recommendations']
         if not all(key in analysis for key in required_keys):
             raise ValueError(f"AI response missing required keys: {required_keys}")
         
-        # Ensure pipeline_key matches
-        analysis['pipeline_key'] = pipeline_key
-        
-        # Validate top_errors structure
-        if not isinstance(analysis.get('top_errors'), list):
-            analysis['top_errors'] = []
-        
-        for error in analysis['top_errors']:
-            if not isinstance(error, dict) or 'message' not in error or 'count' not in error:
-                # Fix malformed error entries
-                if isinstance(error, str):
-                    error = {'message': error, 'count': 1}
-                elif isinstance(error, dict):
-                    error.setdefault('message', 'Unknown error')
-                    error.setdefault('count', 1)
-        
-        # Validate recommendations structure
-        if not isinstance(analysis.get('recommendations'), list):
-            analysis['recommendations'] = []
-        
-        return analysis
+        # Build the validated result in one pass, fixing malformed entries
+        top_errors = analysis['top_errors']
+        recommendations = analysis['recommendations']
+        return {
+            'pipeline_key': pipeline_key,  # Ensure pipeline_key matches
+            'summary': analysis['summary'],
+            'top_errors': [_normalize_error(error) for error in top_errors] if isinstance(top_errors, list) else [],
+            'recommendations': recommendations if isinstance(recommendations, list) else []
+        }
         
     except (AzureAIError, ValueError, KeyError, TypeError) as e:
         # Fallback to heuristic analysis
@@ -146,6 +168,68 @@ Please respond with valid JSON in this exact format:
         return _heuristic_analysis(pipeline_logs)
 
 
+def _summarize_for_llm(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce pipeline logs to the aggregate statistics sent to the LLM.
+    
+    Args:
+        pipeline_logs: Pipeline log data
+        
+    Returns:
+        Dict with run count, status counts, most common error messages and
+        duration percentiles (in seconds) for completed runs
+    """
+    runs = pipeline_logs.get('runs', [])
+    status_counts = Counter()
+    error_counter = Counter()
+    durations = []
+    
+    for run in runs:
+        status_counts[run.get('status', 'UNKNOWN')] += 1
+        
+        duration = run.get('duration_seconds', 0)
+        if duration > 0:
+            durations.append(duration)
+        
+        for error in run.get('errors', []):
+            if isinstance(error, dict) and 'message' in error:
+                error_counter[error['message']] += 1
+            elif isinstance(error, str):
+                error_counter[error] += 1
+    
+    duration_percentiles = {}
+    if durations:
+        durations.sort()
+        last = len(durations) - 1
+        duration_percentiles = {
+            'p50': durations[last * 50 // 100],
+            'p90': durations[last * 90 // 100],
+            'max': durations[last]
+        }
+    
+    return {
+        'pipeline_key': pipeline_logs.get('pipeline_key', 'UNKNOWN'),
+        'pipeline_name': pipeline_logs.get('pipeline_name', 'Unknown Pipeline'),
+        'run_count': len(runs),
+        'status_counts': dict(status_counts),
+        'top_error_messages': [
+            {'message': message, 'count': count}
+            for message, count in error_counter.most_common(10)
+        ],
+        'duration_percentiles': duration_percentiles
+    }
+
+
+def _error_messages(runs: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the message of every error in the given runs, skipping malformed entries."""
+    for run in runs:
+        for error in run.get('errors', []):
+            if isinstance(error, dict) and 'message' in error:
+                yield error['message']
+            elif isinstance(error, str):
+                yield error
+
+
 def _heuristic_analysis(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
     """
     Provide heuristic analysis of pipeline logs when AI service is unavailable.
@@ -171,26 +255,22 @@ def _heuristic_analysis(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
             'recommendations': ['Configure pipeline to capture execution logs']
         }
     
-    # Calculate basic statistics
+    # Calculate basic statistics and durations in a single pass
     total_runs = len(runs)
-    successful_runs = sum(1 for run in runs if run.get('status') == 'SUCCESS')
-    failed_runs = sum(1 for run in runs if run.get('status') == 'FAILED')
-    in_progress_runs = sum(1 for run in runs if run.get('status') == 'IN_PROGRESS')
-    
-    success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
-    
-    # Collect and count errors
-    all_errors = []
+    successful_runs = 0
+    failed_runs = 0
+    in_progress_runs = 0
     total_duration = 0
     completed_runs = 0
     
     for run in runs:
-        # Collect errors
-        for error in run.get('errors', []):
-            if isinstance(error, dict) and 'message' in error:
-                all_errors.append(error['message'])
-            elif isinstance(error, str):
-                all_errors.append(error)
+        status = run.get('status')
+        if status == 'SUCCESS':
+            successful_runs += 1
+        elif status == 'FAILED':
+            failed_runs += 1
+        elif status == 'IN_PROGRESS':
+            in_progress_runs += 1
         
         # Calculate average duration for completed runs
         duration = run.get('duration_seconds', 0)
@@ -198,8 +278,16 @@ def _heuristic_analysis(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
             total_duration += duration
             completed_runs += 1
     
-    # Count error frequency
-    error_counter = Counter(all_errors)
+    # Count error frequency in one Counter call, then scan each distinct
+    # message once for keywords
+    error_counter = Counter(_error_messages(runs))
+    error_patterns = {
+        match.lastgroup for message in error_counter for match in _ERROR_PATTERN_RE.finditer(message)
+    }
+    
+    success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
+    
+    # Keep only the most frequent errors
     top_errors = [
         {'message': message, 'count': count}
         for message, count in error_counter.most_common(5)
@@ -249,14 +337,13 @@ def _heuristic_analysis(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
         recommendations.append("Monitor currently running builds for potential issues")
     
     # Check for specific error patterns
-    error_messages = " ".join(all_errors).lower()
-    if 'timeout' in error_messages:
+    if 'timeout' in error_patterns:
         recommendations.append("Review timeout configurations and resource allocation")
     
-    if 'test' in error_messages and 'failed' in error_messages:
+    if 'test' in error_patterns and 'failed' in error_patterns:
         recommendations.append("Focus on test stability and test environment configuration")
     
-    if 'connection' in error_messages or 'network' in error_messages:
+    if 'network' in error_patterns:
         recommendations.append("Investigate network connectivity and service dependencies")
     
     if not recommendations:
@@ -283,23 +370,46 @@ def analyze_multiple_pipelines(all_pipeline_logs: List[Dict[str, Any]]) -> List[
     Returns:
         List of analysis results for each pipeline
     """
-    analyses = []
-    
-    for pipeline_logs in all_pipeline_logs:
-        try:
-            analysis = analyze_pipeline_logs(pipeline_logs)
-            analyses.append(analysis)
-        except Exception as e:
-            # Ensure we always return something for each pipeline
-            pipeline_key = pipeline_logs.get('pipeline_key', 'UNKNOWN')
-            analyses.append({
-                'pipeline_key': pipeline_key,
-                'summary': f"Analysis failed for {pipeline_key}: {str(e)}",
-                'top_errors': [],
-                'recommendations': ['Manual investigation required due to analysis error']
-            })
-    
-    return analyses
+    if not all_pipeline_logs:
+        return []
+    
+    # Resolve the shared client once for the whole batch. get_client() caches the
+    # instance, but a configuration error is re-raised (and the environment
+    # re-read) on every call, so skip straight to heuristics in that case
+    try:
+        get_client()
+    except AzureAIError as e:
+        print(f"AI analysis unavailable ({e}), falling back to heuristic analysis")
+        return [_heuristic_analysis(pipeline_logs) for pipeline_logs in all_pipeline_logs]
+    
+    # Each analysis is an independent LLM round-trip, so run them concurrently;
+    # map() keeps results in the same order as the input pipelines
+    max_workers = min(_MAX_CONCURRENT_ANALYSES, len(all_pipeline_logs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_safe_analyze_pipeline_logs, all_pipeline_logs))
+
+
+def _safe_analyze_pipeline_logs(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze a single pipeline, returning a placeholder analysis on unexpected errors.
+    
+    Args:
+        pipeline_logs: Pipeline log data
+        
+    Returns:
+        Analysis result for the pipeline
+    """
+    try:
+        return analyze_pipeline_logs(pipeline_logs)
+    except Exception as e:
+        # Ensure we always return something for each pipeline
+        pipeline_key = pipeline_logs.get('pipeline_key', 'UNKNOWN')
+        return {
+            'pipeline_key': pipeline_key,
+            'summary': f"Analysis failed for {pipeline_key}: {str(e)}",
+            'top_errors': [],
+            'recommendations': ['Manual investigation required due to analysis error']
+        }
 
 
 def get_fleet_summary(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -322,18 +432,27 @@ def get_fleet_summary(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     total_pipelines = len(analyses)
     
-    # Extract all errors across pipelines
-    all_errors = []
-    all_recommendations = []
+    # Count errors and recommendations and score health in a single pass
+    error_counter = Counter()
+    recommendation_counter = Counter()
+    health_score = 0
     
     for analysis in analyses:
-        for error in analysis.get('top_errors', []):
-            all_errors.append(error.get('message', ''))
+        # Healthy pipelines usually report no errors; skip the update for them
+        top_errors = analysis.get('top_errors')
+        if top_errors:
+            error_counter.update(error.get('message', '') for error in top_errors)
+        
+        recommendation_counter.update(analysis.get('recommendations', []))
         
-        all_recommendations.extend(analysis.get('recommendations', []))
+        summary = analysis.get('summary', '').lower()
+        tokens = set(_WORD_RE.findall(summary))
+        if tokens & _HEALTHY_WORDS or any(phrase in summary for phrase in _HEALTHY_PHRASES):
+            health_score += 1
+        elif tokens & _UNHEALTHY_WORDS or any(phrase in summary for phrase in _UNHEALTHY_PHRASES):
+            health_score -= 1
     
     # Find common error patterns
-    error_counter = Counter(all_errors)
     common_issues = [
         {'issue': issue, 'affected_pipelines': count}
         for issue, count in error_counter.most_common(3)
@@ -341,24 +460,12 @@ def get_fleet_summary(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
     ]
     
     # Find common recommendations
-    recommendation_counter = Counter(all_recommendations)
     fleet_recommendations = [
         rec for rec, count in recommendation_counter.most_common(5)
         if count > 1  # Recommendations that apply to multiple pipelines
     ]
     
     # Determine overall health (simplified heuristic)
-    healthy_keywords = ['excellent', 'good', 'performing well', 'consistent success']
-    unhealthy_keywords = ['poor', 'concerning', 'failures', 'requires attention']
-    
-    health_score = 0
-    for analysis in analyses:
-        summary = analysis.get('summary', '').lower()
-        if any(keyword in summary for keyword in healthy_keywords):
-            health_score += 1
-        elif any(keyword in summary for keyword in unhealthy_keywords):
-            health_score -= 1
-    
     if health_score > len(analyses) * 0.5:
         overall_health = 'good'
     elif health_score < -len(analyses) * 0.3:
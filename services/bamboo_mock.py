@@ -5,347 +5,389 @@ This module provides static mock data that mimics Bamboo CI/CD plan responses
 for deterministic testing and development without requiring actual Bamboo server access.
 """
 
-from typing import Dict, Any
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Optional, Tuple
 
+# Base URL of the mocked Bamboo REST API, shared by all links
+_HREF: Final = "https://bamboo.company.com/rest/api/latest"
 
-def get_bamboo_plans() -> Dict[str, Any]:
+def _make_plan(
+    short_name: str,
+    name: str,
+    project_name: str,
+    description: str,
+    enabled: bool,
+    building: bool,
+    average_build_time: int,
+    actions: int,
+    stages: int,
+    branches: int,
+    variables: int
+) -> Dict[str, Any]:
     """
-    Get static Bamboo-like JSON payload with 3 predefined plans.
-    
-    Returns deterministic mock data suitable for testing that mimics
-    the structure of Bamboo's plan listing API response.
+    Build one plan entry of the Bamboo plan listing.
     
+    Args:
+        short_name: Short plan name, also used as the plan key suffix
+        name: Full plan name
+        project_name: Name of the owning project
+        description: Plan description
+        enabled: Whether the plan is enabled (and active)
+        building: Whether a build is currently running
+        average_build_time: Average build time in seconds
+        actions: Number of plan actions
+        stages: Number of plan stages
+        branches: Number of plan branches
+        variables: Number of plan variables
+        
     Returns:
-        Dict containing Bamboo-like plan data with exactly 3 plans:
-        - PROJ-PLAN1: Enabled plan with successful build
-        - PROJ-PLAN2: Disabled plan with failed build
-        - PROJ-PLAN3: Enabled plan with in-progress build
+        Dict shaped like a plan in Bamboo's plan listing API response
     """
+    key = f"PROJ-{short_name}"
     return {
-        "plans": {
-            "size": 3,
+        "shortName": short_name,
+        "shortKey": short_name,
+        "type": "chain",
+        "enabled": enabled,
+        "link": {
+            "href": f"{_HREF}/plan/{key}",
+            "rel": "self"
+        },
+        "key": key,
+        "name": name,
+        "planKey": {
+            "key": key
+        },
+        "projectKey": "PROJ",
+        "projectName": project_name,
+        "description": description,
+        "isActive": enabled,
+        "isBuilding": building,
+        "averageBuildTimeInSeconds": average_build_time,
+        "actions": {"size": actions, "start-index": 0, "max-result": actions},
+        "stages": {"size": stages, "start-index": 0, "max-result": stages},
+        "branches": {"size": branches, "start-index": 0, "max-result": 25},
+        "variableContext": {"size": variables, "start-index": 0, "max-result": 25}
+    }
+
+
+# Static plan listing, built once at import and shared by every call
+_BAMBOO_PLANS: Final[Dict[str, Any]] = {
+    "plans": {
+        "size": 3,
+        "start-index": 0,
+        "max-result": 25,
+        "plan": [
+            _make_plan(
+                "PLAN1", "Project Alpha - Build and Deploy", "Project Alpha",
+                "Main build and deployment pipeline for Project Alpha",
+                enabled=True, building=False, average_build_time=420,
+                actions=2, stages=3, branches=1, variables=5
+            ),
+            _make_plan(
+                "PLAN2", "Project Beta - Testing Pipeline", "Project Beta",
+                "Automated testing pipeline for Project Beta components",
+                enabled=False, building=False, average_build_time=180,
+                actions=1, stages=2, branches=1, variables=3
+            ),
+            _make_plan(
+                "PLAN3", "Project Gamma - Integration Tests", "Project Gamma",
+                "End-to-end integration testing for Project Gamma services",
+                enabled=True, building=True, average_build_time=840,
+                actions=3, stages=4, branches=2, variables=8
+            )
+        ]
+    },
+    "expand": "plans.plan",
+    "link": {
+        "href": f"{_HREF}/plan",
+        "rel": "self"
+    }
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Plan:
+    """Read-only view of the commonly used fields of a Bamboo plan."""
+    key: str
+    name: str
+    enabled: bool
+    project_key: str
+    project_name: str
+    is_active: bool
+    is_building: bool
+    average_build_time_seconds: int
+    link: str
+
+
+# Structured plans, built once for callers that only need the common fields
+_PLAN_OBJECTS: Final[Tuple[Plan, ...]] = tuple(
+    Plan(
+        key=plan["key"],
+        name=plan["name"],
+        enabled=plan["enabled"],
+        project_key=plan["projectKey"],
+        project_name=plan["projectName"],
+        is_active=plan["isActive"],
+        is_building=plan["isBuilding"],
+        average_build_time_seconds=plan["averageBuildTimeInSeconds"],
+        link=plan["link"]["href"]
+    )
+    for plan in _BAMBOO_PLANS["plans"]["plan"]
+)
+
+# Plans indexed by key, so build results can reference them instead of copying
+_PLAN_BY_KEY: Final[Dict[str, Dict[str, Any]]] = {plan["key"]: plan for plan in _BAMBOO_PLANS["plans"]["plan"]}
+
+# Key projections for callers that do not need the plan payloads
+_ALL_PLAN_KEYS: Final[Tuple[str, ...]] = tuple(_PLAN_BY_KEY)
+_ENABLED_PLAN_KEYS: Final[Tuple[str, ...]] = tuple(key for key, plan in _PLAN_BY_KEY.items() if plan["enabled"])
+
+# Plan fields embedded in each build result
+_PLAN_SUMMARY_FIELDS: Final = ("shortName", "shortKey", "type", "enabled", "link", "key", "name")
+
+
+def _plan_summary(plan_key: str) -> Dict[str, Any]:
+    """Project a plan onto the fields embedded in its build results (values are shared)."""
+    plan = _PLAN_BY_KEY[plan_key]
+    return {field: plan[field] for field in _PLAN_SUMMARY_FIELDS}
+
+
+# Static build results by plan key for deterministic testing
+_RESULTS_BY_KEY: Final[Dict[str, Dict[str, Any]]] = {
+    "PROJ-PLAN1": {
+        "results": {
+            "size": 1,
             "start-index": 0,
             "max-result": 25,
-            "plan": [
+            "result": [
                 {
-                    "shortName": "PLAN1",
-                    "shortKey": "PLAN1", 
-                    "type": "chain",
-                    "enabled": True,
+                    "expand": "changes,metadata,plan,vcs,artifacts,comments,labels,jiraIssues,stages",
                     "link": {
-                        "href": "https://bamboo.company.com/rest/api/latest/plan/PROJ-PLAN1",
+                        "href": f"{_HREF}/result/PROJ-PLAN1-123",
                         "rel": "self"
                     },
-                    "key": "PROJ-PLAN1",
-                    "name": "Project Alpha - Build and Deploy",
-                    "planKey": {
-                        "key": "PROJ-PLAN1"
-                    },
-                    "projectKey": "PROJ",
+                    "plan": _plan_summary("PROJ-PLAN1"),
+                    "planName": "Project Alpha - Build and Deploy",
                     "projectName": "Project Alpha",
-                    "description": "Main build and deployment pipeline for Project Alpha",
-                    "isActive": True,
-                    "isBuilding": False,
-                    "averageBuildTimeInSeconds": 420,
-                    "actions": {
-                        "size": 2,
-                        "start-index": 0,
-                        "max-result": 2
-                    },
-                    "stages": {
-                        "size": 3,
-                        "start-index": 0,
-                        "max-result": 3
-                    },
-                    "branches": {
-                        "size": 1,
-                        "start-index": 0,
-                        "max-result": 25
-                    },
-                    "variableContext": {
-                        "size": 5,
-                        "start-index": 0,
-                        "max-result": 25
-                    }
-                },
+                    "buildResultKey": "PROJ-PLAN1-123",
+                    "lifeCycleState": "Finished",
+                    "id": 123,
+                    "buildNumber": 123,
+                    "state": "Successful",
+                    "buildState": "Successful",
+                    "number": 123,
+                    "buildRelativeTime": "2 hours ago",
+                    "buildTestSummary": "3 passed",
+                    "successfulTestCount": 3,
+                    "failedTestCount": 0,
+                    "quarantinedTestCount": 0,
+                    "skippedTestCount": 0,
+                    "continuable": False,
+                    "onceOff": False,
+                    "restartable": False,
+                    "notRunYet": False,
+                    "finished": True,
+                    "successful": True,
+                    "buildReason": "Manual run by admin",
+                    "reasonSummary": "Manual run by admin",
+                    "buildDurationInSeconds": 385,
+                    "buildDuration": 385000,
+                    "buildDurationDescription": "6 minutes",
+                    "vcsRevisionKey": "abc123def456",
+                    "key": "PROJ-PLAN1-123"
+                }
+            ]
+        }
+    },
+    "PROJ-PLAN2": {
+        "results": {
+            "size": 1, 
+            "start-index": 0,
+            "max-result": 25,
+            "result": [
                 {
-                    "shortName": "PLAN2",
-                    "shortKey": "PLAN2",
-                    "type": "chain", 
-                    "enabled": False,
+                    "expand": "changes,metadata,plan,vcs,artifacts,comments,labels,jiraIssues,stages",
                     "link": {
-                        "href": "https://bamboo.company.com/rest/api/latest/plan/PROJ-PLAN2",
+                        "href": f"{_HREF}/result/PROJ-PLAN2-87",
                         "rel": "self"
                     },
-                    "key": "PROJ-PLAN2",
-                    "name": "Project Beta - Testing Pipeline",
-                    "planKey": {
-                        "key": "PROJ-PLAN2"
-                    },
-                    "projectKey": "PROJ",
-                    "projectName": "Project Beta",
-                    "description": "Automated testing pipeline for Project Beta components",
-                    "isActive": False,
-                    "isBuilding": False,
-                    "averageBuildTimeInSeconds": 180,
-                    "actions": {
-                        "size": 1,
-                        "start-index": 0,
-                        "max-result": 1
-                    },
-                    "stages": {
-                        "size": 2,
-                        "start-index": 0,
-                        "max-result": 2
-                    },
-                    "branches": {
-                        "size": 1,
-                        "start-index": 0,
-                        "max-result": 25
-                    },
-                    "variableContext": {
-                        "size": 3,
-                        "start-index": 0,
-                        "max-result": 25
-                    }
-                },
+                    "plan": _plan_summary("PROJ-PLAN2"),
+                    "planName": "Project Beta - Testing Pipeline",
+                    "projectName": "Project Beta", 
+                    "buildResultKey": "PROJ-PLAN2-87",
+                    "lifeCycleState": "Finished",
+                    "id": 87,
+                    "buildNumber": 87,
+                    "state": "Failed",
+                    "buildState": "Failed",
+                    "number": 87,
+                    "buildRelativeTime": "1 day ago",
+                    "buildTestSummary": "2 passed, 1 failed",
+                    "successfulTestCount": 2,
+                    "failedTestCount": 1,
+                    "quarantinedTestCount": 0,
+                    "skippedTestCount": 0,
+                    "continuable": False,
+                    "onceOff": False,
+                    "restartable": True,
+                    "notRunYet": False,
+                    "finished": True,
+                    "successful": False,
+                    "buildReason": "Code has been updated by developer",
+                    "reasonSummary": "Code has been updated by developer",
+                    "buildDurationInSeconds": 145,
+                    "buildDuration": 145000,
+                    "buildDurationDescription": "2 minutes",
+                    "vcsRevisionKey": "def456ghi789",
+                    "key": "PROJ-PLAN2-87"
+                }
+            ]
+        }
+    },
+    "PROJ-PLAN3": {
+        "results": {
+            "size": 1,
+            "start-index": 0,
+            "max-result": 25,
+            "result": [
                 {
-                    "shortName": "PLAN3",
-                    "shortKey": "PLAN3",
-                    "type": "chain",
-                    "enabled": True,
+                    "expand": "changes,metadata,plan,vcs,artifacts,comments,labels,jiraIssues,stages",
                     "link": {
-                        "href": "https://bamboo.company.com/rest/api/latest/plan/PROJ-PLAN3", 
+                        "href": f"{_HREF}/result/PROJ-PLAN3-201",
                         "rel": "self"
                     },
-                    "key": "PROJ-PLAN3",
-                    "name": "Project Gamma - Integration Tests",
-                    "planKey": {
-                        "key": "PROJ-PLAN3"
-                    },
-                    "projectKey": "PROJ",
+                    "plan": _plan_summary("PROJ-PLAN3"),
+                    "planName": "Project Gamma - Integration Tests",
                     "projectName": "Project Gamma",
-                    "description": "End-to-end integration testing for Project Gamma services",
-                    "isActive": True,
-                    "isBuilding": True,
-                    "averageBuildTimeInSeconds": 840,
-                    "actions": {
-                        "size": 3,
-                        "start-index": 0,
-                        "max-result": 3
-                    },
-                    "stages": {
-                        "size": 4,
-                        "start-index": 0,
-                        "max-result": 4
-                    },
-                    "branches": {
-                        "size": 2,
-                        "start-index": 0,
-                        "max-result": 25
-                    },
-                    "variableContext": {
-                        "size": 8,
-                        "start-index": 0,
-                        "max-result": 25
-                    }
+                    "buildResultKey": "PROJ-PLAN3-201",
+                    "lifeCycleState": "InProgress",
+                    "id": 201,
+                    "buildNumber": 201,
+                    "state": "Unknown",
+                    "buildState": "Unknown",
+                    "number": 201,
+                    "buildRelativeTime": "5 minutes ago",
+                    "buildTestSummary": "Running...",
+                    "successfulTestCount": 0,
+                    "failedTestCount": 0,
+                    "quarantinedTestCount": 0,
+                    "skippedTestCount": 0,
+                    "continuable": False,
+                    "onceOff": False,
+                    "restartable": False,
+                    "notRunYet": False,
+                    "finished": False,
+                    "successful": False,
+                    "buildReason": "Scheduled trigger",
+                    "reasonSummary": "Scheduled trigger",
+                    "buildDurationInSeconds": 0,
+                    "buildDuration": 0,
+                    "buildDurationDescription": "Currently running",
+                    "vcsRevisionKey": "ghi789jkl012",
+                    "key": "PROJ-PLAN3-201"
                 }
             ]
-        },
-        "expand": "plans.plan",
-        "link": {
-            "href": "https://bamboo.company.com/rest/api/latest/plan",
-            "rel": "self"
         }
     }
+}
 
+# Result returned for unknown plan keys; shared like the per-plan results
+_EMPTY_RESULT: Final[Dict[str, Any]] = {"results": {"size": 0, "result": []}}
 
-def get_plan_results(plan_key: str) -> Dict[str, Any]:
+# Bound lookup for get_plan_results; skips the attribute lookup on every call
+_lookup_results: Final = _RESULTS_BY_KEY.get
+
+
+def get_bamboo_plans(mutable: bool = False) -> Dict[str, Any]:
+    """
+    Get static Bamboo-like JSON payload with 3 predefined plans.
+    
+    Returns deterministic mock data suitable for testing that mimics
+    the structure of Bamboo's plan listing API response.
+    
+    The same payload object is returned on every call, so callers must treat
+    it as read-only unless they request a private copy.
+    
+    Args:
+        mutable: Return a deep copy that the caller may modify
+    
+    Returns:
+        Dict containing Bamboo-like plan data with exactly 3 plans:
+        - PROJ-PLAN1: Enabled plan with successful build
+        - PROJ-PLAN2: Disabled plan with failed build
+        - PROJ-PLAN3: Enabled plan with in-progress build
+    """
+    if mutable:
+        return deepcopy(_BAMBOO_PLANS)
+    return _BAMBOO_PLANS
+
+
+def get_bamboo_plans_objects() -> Tuple[Plan, ...]:
+    """
+    Get the Bamboo plans as immutable Plan objects.
+    
+    A lighter alternative to get_bamboo_plans() for callers that only need
+    the common plan fields rather than the full API-shaped payload.
+    
+    Returns:
+        Tuple of Plan objects in listing order
+    """
+    return _PLAN_OBJECTS
+
+
+def list_plan_keys() -> Tuple[str, ...]:
+    """
+    Get the keys of all Bamboo plans without walking the plan listing.
+    
+    Returns:
+        Tuple of plan keys in listing order
+    """
+    return _ALL_PLAN_KEYS
+
+
+def list_enabled_plan_keys() -> Tuple[str, ...]:
+    """
+    Get the keys of the enabled Bamboo plans.
+    
+    Returns:
+        Tuple of enabled plan keys in listing order
+    """
+    return _ENABLED_PLAN_KEYS
+
+
+def get_plan(plan_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a single plan entry from the Bamboo plan listing.
+    
+    The entry is shared with get_bamboo_plans() and must be treated as
+    read-only.
+    
+    Args:
+        plan_key: The plan key (e.g., 'PROJ-PLAN1')
+        
+    Returns:
+        Plan entry dict, or None if the plan does not exist
+    """
+    return _PLAN_BY_KEY.get(plan_key)
+
+
+def get_plan_results(plan_key: str, mutable: bool = False) -> Dict[str, Any]:
     """
     Get static Bamboo-like JSON payload for plan build results.
     
+    The same payload object is returned on every call for a given plan, so
+    callers must treat it as read-only unless they request a private copy.
+    
     Args:
         plan_key: The plan key (e.g., 'PROJ-PLAN1')
+        mutable: Return a deep copy that the caller may modify
         
     Returns:
         Dict containing mock build results for the specified plan
     """
-    # Static results based on plan key for deterministic testing
-    results_data = {
-        "PROJ-PLAN1": {
-            "results": {
-                "size": 1,
-                "start-index": 0,
-                "max-result": 25,
-                "result": [
-                    {
-                        "expand": "changes,metadata,plan,vcs,artifacts,comments,labels,jiraIssues,stages",
-                        "link": {
-                            "href": "https://bamboo.company.com/rest/api/latest/result/PROJ-PLAN1-123",
-                            "rel": "self"
-                        },
-                        "plan": {
-                            "shortName": "PLAN1",
-                            "shortKey": "PLAN1",
-                            "type": "chain",
-                            "enabled": True,
-                            "link": {
-                                "href": "https://bamboo.company.com/rest/api/latest/plan/PROJ-PLAN1",
-                                "rel": "self"
-                            },
-                            "key": "PROJ-PLAN1",
-                            "name": "Project Alpha - Build and Deploy"
-                        },
-                        "planName": "Project Alpha - Build and Deploy",
-                        "projectName": "Project Alpha",
-                        "buildResultKey": "PROJ-PLAN1-123",
-                        "lifeCycleState": "Finished",
-                        "id": 123,
-                        "buildNumber": 123,
-                        "state": "Successful",
-                        "buildState": "Successful",
-                        "number": 123,
-                        "buildRelativeTime": "2 hours ago",
-                        "buildTestSummary": "3 passed",
-                        "successfulTestCount": 3,
-                        "failedTestCount": 0,
-                        "quarantinedTestCount": 0,
-                        "skippedTestCount": 0,
-                        "continuable": False,
-                        "onceOff": False,
-                        "restartable": False,
-                        "notRunYet": False,
-                        "finished": True,
-                        "successful": True,
-                        "buildReason": "Manual run by admin",
-                        "reasonSummary": "Manual run by admin",
-                        "buildDurationInSeconds": 385,
-                        "buildDuration": 385000,
-                        "buildDurationDescription": "6 minutes",
-                        "buildRelativeTime": "2 hours ago",
-                        "vcsRevisionKey": "abc123def456",
-                        "buildTestSummary": "3 passed",
-                        "key": "PROJ-PLAN1-123"
-                    }
-                ]
-            }
-        },
-        "PROJ-PLAN2": {
-            "results": {
-                "size": 1, 
-                "start-index": 0,
-                "max-result": 25,
-                "result": [
-                    {
-                        "expand": "changes,metadata,plan,vcs,artifacts,comments,labels,jiraIssues,stages",
-                        "link": {
-                            "href": "https://bamboo.company.com/rest/api/latest/result/PROJ-PLAN2-87",
-                            "rel": "self"
-                        },
-                        "plan": {
-                            "shortName": "PLAN2",
-                            "shortKey": "PLAN2", 
-                            "type": "chain",
-                            "enabled": False,
-                            "link": {
-                                "href": "https://bamboo.company.com/rest/api/latest/plan/PROJ-PLAN2",
-                                "rel": "self"
-                            },
-                            "key": "PROJ-PLAN2",
-                            "name": "Project Beta - Testing Pipeline"
-                        },
-                        "planName": "Project Beta - Testing Pipeline",
-                        "projectName": "Project Beta", 
-                        "buildResultKey": "PROJ-PLAN2-87",
-                        "lifeCycleState": "Finished",
-                        "id": 87,
-                        "buildNumber": 87,
-                        "state": "Failed",
-                        "buildState": "Failed",
-                        "number": 87,
-                        "buildRelativeTime": "1 day ago",
-                        "buildTestSummary": "2 passed, 1 failed",
-                        "successfulTestCount": 2,
-                        "failedTestCount": 1,
-                        "quarantinedTestCount": 0,
-                        "skippedTestCount": 0,
-                        "continuable": False,
-                        "onceOff": False,
-                        "restartable": True,
-                        "notRunYet": False,
-                        "finished": True,
-                        "successful": False,
-                        "buildReason": "Code has been updated by developer",
-                        "reasonSummary": "Code has been updated by developer",
-                        "buildDurationInSeconds": 145,
-                        "buildDuration": 145000,
-                        "buildDurationDescription": "2 minutes",
-                        "buildRelativeTime": "1 day ago",
-                        "vcsRevisionKey": "def456ghi789",
-                        "buildTestSummary": "2 passed, 1 failed",
-                        "key": "PROJ-PLAN2-87"
-                    }
-                ]
-            }
-        },
-        "PROJ-PLAN3": {
-            "results": {
-                "size": 1,
-                "start-index": 0,
-                "max-result": 25,
-                "result": [
-                    {
-                        "expand": "changes,metadata,plan,vcs,artifacts,comments,labels,jiraIssues,stages",
-                        "link": {
-                            "href": "https://bamboo.company.com/rest/api/latest/result/PROJ-PLAN3-201",
-                            "rel": "self"
-                        },
-                        "plan": {
-                            "shortName": "PLAN3",
-                            "shortKey": "PLAN3",
-                            "type": "chain", 
-                            "enabled": True,
-                            "link": {
-                                "href": "https://bamboo.company.com/rest/api/latest/plan/PROJ-PLAN3",
-                                "rel": "self"
-                            },
-                            "key": "PROJ-PLAN3",
-                            "name": "Project Gamma - Integration Tests"
-                        },
-                        "planName": "Project Gamma - Integration Tests",
-                        "projectName": "Project Gamma",
-                        "buildResultKey": "PROJ-PLAN3-201",
-                        "lifeCycleState": "InProgress",
-                        "id": 201,
-                        "buildNumber": 201,
-                        "state": "Unknown",
-                        "buildState": "Unknown",
-                        "number": 201,
-                        "buildRelativeTime": "5 minutes ago",
-                        "buildTestSummary": "Running...",
-                        "successfulTestCount": 0,
-                        "failedTestCount": 0,
-                        "quarantinedTestCount": 0,
-                        "skippedTestCount": 0,
-                        "continuable": False,
-                        "onceOff": False,
-                        "restartable": False,
-                        "notRunYet": False,
-                        "finished": False,
-                        "successful": False,
-                        "buildReason": "Scheduled trigger",
-                        "reasonSummary": "Scheduled trigger",
-                        "buildDurationInSeconds": 0,
-                        "buildDuration": 0,
-                        "buildDurationDescription": "Currently running",
-                        "buildRelativeTime": "5 minutes ago",
-                        "vcsRevisionKey": "ghi789jkl012",
-                        "buildTestSummary": "Running...",
-                        "key": "PROJ-PLAN3-201"
-                    }
-                ]
-            }
-        }
-    }
-    
-    return results_data.get(plan_key, {"results": {"size": 0, "result": []}})
\ No newline at end of file
+    results = _lookup_results(plan_key, _EMPTY_RESULT)
+    if mutable:
+        return deepcopy(results)
+    return results
@@ -6,351 +6,439 @@ with deterministic content including run durations, error information, and
 execution details for reliable testing.
 """
 
-from typing import Dict, List, Any
+from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any, Iterator
 
-def get_pipeline_logs(pipeline_key: str) -> Dict[str, Any]:
+# Pipeline fields that may carry the pipeline key, in order of preference
+_KEY_FIELDS = ('key', 'planKey', 'pipeline_key', 'id')
+
+# Static log data based on pipeline key for deterministic testing
+_LOGS_DATA: dict[str, dict[str, Any]] = {
+    "PROJ-PLAN1": {
+        "pipeline_key": "PROJ-PLAN1",
+        "pipeline_name": "Project Alpha - Build and Deploy",
+        "total_runs": 3,
+        "runs": [
+            {
+                "run_id": "run-001",
+                "build_number": 123,
+                "status": "SUCCESS",
+                "started_at": "2025-09-17T10:15:30Z",
+                "completed_at": "2025-09-17T10:21:55Z",
+                "duration_seconds": 385,
+                "triggered_by": "admin",
+                "branch": "main",
+                "commit_hash": "abc123def456",
+                "errors": [],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 15,
+                        "output": "Successfully checked out main branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS", 
+                        "duration_seconds": 240,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 85,
+                        "output": "All 3 tests passed"
+                    },
+                    {
+                        "step": "deploy",
+                        "status": "SUCCESS",
+                        "duration_seconds": 45,
+                        "output": "Deployment to staging completed"
+                    }
+                ]
+            },
+            {
+                "run_id": "run-002",
+                "build_number": 122,
+                "status": "SUCCESS",
+                "started_at": "2025-09-17T09:30:12Z",
+                "completed_at": "2025-09-17T09:37:48Z",
+                "duration_seconds": 456,
+                "triggered_by": "developer",
+                "branch": "main",
+                "commit_hash": "xyz789abc123",
+                "errors": [],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 18,
+                        "output": "Successfully checked out main branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS",
+                        "duration_seconds": 285,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 98,
+                        "output": "All 3 tests passed"
+                    },
+                    {
+                        "step": "deploy",
+                        "status": "SUCCESS",
+                        "duration_seconds": 55,
+                        "output": "Deployment to staging completed"
+                    }
+                ]
+            },
+            {
+                "run_id": "run-003",
+                "build_number": 121,
+                "status": "SUCCESS",
+                "started_at": "2025-09-16T16:45:20Z",
+                "completed_at": "2025-09-16T16:52:35Z",
+                "duration_seconds": 435,
+                "triggered_by": "scheduler",
+                "branch": "main",
+                "commit_hash": "def456ghi789",
+                "errors": [],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 12,
+                        "output": "Successfully checked out main branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS",
+                        "duration_seconds": 265,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 105,
+                        "output": "All 3 tests passed"
+                    },
+                    {
+                        "step": "deploy",
+                        "status": "SUCCESS",
+                        "duration_seconds": 53,
+                        "output": "Deployment to staging completed"
+                    }
+                ]
+            }
+        ]
+    },
+    "PROJ-PLAN2": {
+        "pipeline_key": "PROJ-PLAN2",
+        "pipeline_name": "Project Beta - Testing Pipeline",
+        "total_runs": 2,
+        "runs": [
+            {
+                "run_id": "run-087",
+                "build_number": 87,
+                "status": "FAILED",
+                "started_at": "2025-09-16T14:20:15Z",
+                "completed_at": "2025-09-16T14:22:40Z",
+                "duration_seconds": 145,
+                "triggered_by": "developer",
+                "branch": "feature/new-tests",
+                "commit_hash": "def456ghi789",
+                "errors": [
+                    {
+                        "step": "test",
+                        "message": "Test 'test_user_validation' failed: AssertionError: Expected 'valid' but got 'invalid'"
+                    },
+                    {
+                        "step": "test",
+                        "message": "1 out of 3 tests failed"
+                    }
+                ],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 10,
+                        "output": "Successfully checked out feature/new-tests branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS",
+                        "duration_seconds": 95,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "test",
+                        "status": "FAILED",
+                        "duration_seconds": 40,
+                        "output": "Test execution failed: 2 passed, 1 failed"
+                    }
+                ]
+            },
+            {
+                "run_id": "run-086",
+                "build_number": 86,
+                "status": "SUCCESS",
+                "started_at": "2025-09-16T13:15:45Z",
+                "completed_at": "2025-09-16T13:18:50Z",
+                "duration_seconds": 185,
+                "triggered_by": "developer",
+                "branch": "main",
+                "commit_hash": "ghi789jkl012",
+                "errors": [],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 8,
+                        "output": "Successfully checked out main branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS",
+                        "duration_seconds": 120,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 57,
+                        "output": "All 3 tests passed"
+                    }
+                ]
+            }
+        ]
+    },
+    "PROJ-PLAN3": {
+        "pipeline_key": "PROJ-PLAN3",
+        "pipeline_name": "Project Gamma - Integration Tests",
+        "total_runs": 3,
+        "runs": [
+            {
+                "run_id": "run-201",
+                "build_number": 201,
+                "status": "IN_PROGRESS",
+                "started_at": "2025-09-17T11:45:30Z",
+                "completed_at": None,
+                "duration_seconds": 0,
+                "triggered_by": "scheduler",
+                "branch": "main",
+                "commit_hash": "ghi789jkl012",
+                "errors": [],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 15,
+                        "output": "Successfully checked out main branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "IN_PROGRESS",
+                        "duration_seconds": 0,
+                        "output": "Build in progress..."
+                    }
+                ]
+            },
+            {
+                "run_id": "run-200",
+                "build_number": 200,
+                "status": "FAILED",
+                "started_at": "2025-09-17T08:30:20Z",
+                "completed_at": "2025-09-17T08:44:15Z",
+                "duration_seconds": 835,
+                "triggered_by": "developer",
+                "branch": "develop",
+                "commit_hash": "jkl012mno345",
+                "errors": [
+                    {
+                        "step": "integration-test",
+                        "message": "Database connection timeout: Unable to connect to test database after 30 seconds"
+                    },
+                    {
+                        "step": "integration-test",
+                        "message": "Service 'user-service' failed health check: HTTP 503 Service Unavailable"
+                    },
+                    {
+                        "step": "integration-test",
+                        "message": "Integration test suite failed: 5 out of 12 tests failed due to service dependencies"
+                    }
+                ],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 12,
+                        "output": "Successfully checked out develop branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS",
+                        "duration_seconds": 320,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "unit-test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 180,
+                        "output": "All 25 unit tests passed"
+                    },
+                    {
+                        "step": "integration-test",
+                        "status": "FAILED",
+                        "duration_seconds": 323,
+                        "output": "Integration tests failed: 7 passed, 5 failed"
+                    }
+                ]
+            },
+            {
+                "run_id": "run-199",
+                "build_number": 199,
+                "status": "SUCCESS",
+                "started_at": "2025-09-16T20:15:10Z",
+                "completed_at": "2025-09-16T20:29:25Z",
+                "duration_seconds": 855,
+                "triggered_by": "scheduler",
+                "branch": "main",
+                "commit_hash": "mno345pqr678",
+                "errors": [],
+                "steps": [
+                    {
+                        "step": "checkout",
+                        "status": "SUCCESS",
+                        "duration_seconds": 10,
+                        "output": "Successfully checked out main branch"
+                    },
+                    {
+                        "step": "build",
+                        "status": "SUCCESS",
+                        "duration_seconds": 345,
+                        "output": "Build completed successfully"
+                    },
+                    {
+                        "step": "unit-test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 195,
+                        "output": "All 25 unit tests passed"
+                    },
+                    {
+                        "step": "integration-test",
+                        "status": "SUCCESS",
+                        "duration_seconds": 305,
+                        "output": "All 12 integration tests passed"
+                    }
+                ]
+            }
+        ]
+    }
+}
+
+
+def _failed_runs(pipeline_logs: dict[str, Any]) -> tuple[dict[str, Any], ...]:
+    """Select the failed runs of a pipeline."""
+    return tuple(run for run in pipeline_logs.get('runs', ()) if run.get('status') == 'FAILED')
+
+
+# Failed runs of each static pipeline, so their errors can be read without
+# walking the successful runs
+_FAILED_RUNS_BY_KEY: dict[str, tuple[dict[str, Any], ...]] = {
+    pipeline_key: _failed_runs(logs) for pipeline_key, logs in _LOGS_DATA.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorDetail:
+    """A single error reported by a failed pipeline run."""
+    run_id: str | None
+    build_number: int | None
+    step: str | None
+    message: str | None
+    timestamp: str | None
+
+
+def _error_details(failed: tuple[dict[str, Any], ...]) -> Iterator[ErrorDetail]:
+    """Yield one detail record per error of the given failed runs."""
+    for run in failed:
+        run_id, build_number, timestamp = run.get('run_id'), run.get('build_number'), run.get('started_at')
+        for error in run.get('errors', ()):
+            yield ErrorDetail(run_id, build_number, error.get('step'), error.get('message'), timestamp)
+
+
+def _compute_error_summary(
+    pipeline_logs: dict[str, Any],
+    failed: tuple[dict[str, Any], ...] | None = None
+) -> dict[str, Any]:
+    """Collect the error statistics of a pipeline, reusing its failed runs if known."""
+    runs = pipeline_logs.get('runs', ())
+    if failed is None:
+        failed = _failed_runs(pipeline_logs)
+    
+    error_details = [
+        {
+            'run_id': run.get('run_id'),
+            'build_number': run.get('build_number'),
+            'step': error.get('step'),
+            'message': error.get('message'),
+            'timestamp': run.get('started_at')
+        }
+        for run in failed
+        for error in run.get('errors', ())
+    ]
+    
+    total_runs = len(runs)
+    failed_runs = len(failed)
+    total_errors = len(error_details)
+    
+    # Success percentage to one decimal, rounded half up in integer arithmetic
+    successful_runs = total_runs - failed_runs
+    success_rate = (successful_runs * 2000 + total_runs) // (2 * total_runs) / 10 if total_runs else 0.0
+    
+    return {
+        'pipeline_key': pipeline_logs.get('pipeline_key'),
+        'pipeline_name': pipeline_logs.get('pipeline_name'),
+        'total_runs': total_runs,
+        'failed_runs': failed_runs,
+        'success_rate': success_rate,
+        'total_errors': total_errors,
+        'error_details': error_details
+    }
+
+
+# Error summaries of the static logs, computed once at import
+_ERROR_SUMMARIES: dict[str, dict[str, Any]] = {
+    pipeline_key: _compute_error_summary(logs, _FAILED_RUNS_BY_KEY[pipeline_key])
+    for pipeline_key, logs in _LOGS_DATA.items()
+}
+
+
+def get_pipeline_logs(pipeline_key: str) -> dict[str, Any]:
     """
     Get static pipeline logs for a specific pipeline key.
     
     Returns deterministic mock log data with multiple runs per pipeline,
     including duration information and error details where applicable.
     
+    Logs for known pipelines are shared between calls, so callers must
+    treat them as read-only.
+    
     Args:
         pipeline_key: The pipeline key (e.g., 'PROJ-PLAN1')
         
     Returns:
         Dict containing pipeline log data with runs, durations, and errors
     """
-    # Static log data based on pipeline key for deterministic testing
-    logs_data = {
-        "PROJ-PLAN1": {
-            "pipeline_key": "PROJ-PLAN1",
-            "pipeline_name": "Project Alpha - Build and Deploy",
-            "total_runs": 3,
-            "runs": [
-                {
-                    "run_id": "run-001",
-                    "build_number": 123,
-                    "status": "SUCCESS",
-                    "started_at": "2025-09-17T10:15:30Z",
-                    "completed_at": "2025-09-17T10:21:55Z",
-                    "duration_seconds": 385,
-                    "triggered_by": "admin",
-                    "branch": "main",
-                    "commit_hash": "abc123def456",
-                    "errors": [],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 15,
-                            "output": "Successfully checked out main branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS", 
-                            "duration_seconds": 240,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 85,
-                            "output": "All 3 tests passed"
-                        },
-                        {
-                            "step": "deploy",
-                            "status": "SUCCESS",
-                            "duration_seconds": 45,
-                            "output": "Deployment to staging completed"
-                        }
-                    ]
-                },
-                {
-                    "run_id": "run-002",
-                    "build_number": 122,
-                    "status": "SUCCESS",
-                    "started_at": "2025-09-17T09:30:12Z",
-                    "completed_at": "2025-09-17T09:37:48Z",
-                    "duration_seconds": 456,
-                    "triggered_by": "developer",
-                    "branch": "main",
-                    "commit_hash": "xyz789abc123",
-                    "errors": [],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 18,
-                            "output": "Successfully checked out main branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS",
-                            "duration_seconds": 285,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 98,
-                            "output": "All 3 tests passed"
-                        },
-                        {
-                            "step": "deploy",
-                            "status": "SUCCESS",
-                            "duration_seconds": 55,
-                            "output": "Deployment to staging completed"
-                        }
-                    ]
-                },
-                {
-                    "run_id": "run-003",
-                    "build_number": 121,
-                    "status": "SUCCESS",
-                    "started_at": "2025-09-16T16:45:20Z",
-                    "completed_at": "2025-09-16T16:52:35Z",
-                    "duration_seconds": 435,
-                    "triggered_by": "scheduler",
-                    "branch": "main",
-                    "commit_hash": "def456ghi789",
-                    "errors": [],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 12,
-                            "output": "Successfully checked out main branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS",
-                            "duration_seconds": 265,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 105,
-                            "output": "All 3 tests passed"
-                        },
-                        {
-                            "step": "deploy",
-                            "status": "SUCCESS",
-                            "duration_seconds": 53,
-                            "output": "Deployment to staging completed"
-                        }
-                    ]
-                }
-            ]
-        },
-        "PROJ-PLAN2": {
-            "pipeline_key": "PROJ-PLAN2",
-            "pipeline_name": "Project Beta - Testing Pipeline",
-            "total_runs": 2,
-            "runs": [
-                {
-                    "run_id": "run-087",
-                    "build_number": 87,
-                    "status": "FAILED",
-                    "started_at": "2025-09-16T14:20:15Z",
-                    "completed_at": "2025-09-16T14:22:40Z",
-                    "duration_seconds": 145,
-                    "triggered_by": "developer",
-                    "branch": "feature/new-tests",
-                    "commit_hash": "def456ghi789",
-                    "errors": [
-                        {
-                            "step": "test",
-                            "message": "Test 'test_user_validation' failed: AssertionError: Expected 'valid' but got 'invalid'"
-                        },
-                        {
-                            "step": "test",
-                            "message": "1 out of 3 tests failed"
-                        }
-                    ],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 10,
-                            "output": "Successfully checked out feature/new-tests branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS",
-                            "duration_seconds": 95,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "test",
-                            "status": "FAILED",
-                            "duration_seconds": 40,
-                            "output": "Test execution failed: 2 passed, 1 failed"
-                        }
-                    ]
-                },
-                {
-                    "run_id": "run-086",
-                    "build_number": 86,
-                    "status": "SUCCESS",
-                    "started_at": "2025-09-16T13:15:45Z",
-                    "completed_at": "2025-09-16T13:18:50Z",
-                    "duration_seconds": 185,
-                    "triggered_by": "developer",
-                    "branch": "main",
-                    "commit_hash": "ghi789jkl012",
-                    "errors": [],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 8,
-                            "output": "Successfully checked out main branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS",
-                            "duration_seconds": 120,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 57,
-                            "output": "All 3 tests passed"
-                        }
-                    ]
-                }
-            ]
-        },
-        "PROJ-PLAN3": {
-            "pipeline_key": "PROJ-PLAN3",
-            "pipeline_name": "Project Gamma - Integration Tests",
-            "total_runs": 3,
-            "runs": [
-                {
-                    "run_id": "run-201",
-                    "build_number": 201,
-                    "status": "IN_PROGRESS",
-                    "started_at": "2025-09-17T11:45:30Z",
-                    "completed_at": None,
-                    "duration_seconds": 0,
-                    "triggered_by": "scheduler",
-                    "branch": "main",
-                    "commit_hash": "ghi789jkl012",
-                    "errors": [],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 15,
-                            "output": "Successfully checked out main branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "IN_PROGRESS",
-                            "duration_seconds": 0,
-                            "output": "Build in progress..."
-                        }
-                    ]
-                },
-                {
-                    "run_id": "run-200",
-                    "build_number": 200,
-                    "status": "FAILED",
-                    "started_at": "2025-09-17T08:30:20Z",
-                    "completed_at": "2025-09-17T08:44:15Z",
-                    "duration_seconds": 835,
-                    "triggered_by": "developer",
-                    "branch": "develop",
-                    "commit_hash": "jkl012mno345",
-                    "errors": [
-                        {
-                            "step": "integration-test",
-                            "message": "Database connection timeout: Unable to connect to test database after 30 seconds"
-                        },
-                        {
-                            "step": "integration-test",
-                            "message": "Service 'user-service' failed health check: HTTP 503 Service Unavailable"
-                        },
-                        {
-                            "step": "integration-test",
-                            "message": "Integration test suite failed: 5 out of 12 tests failed due to service dependencies"
-                        }
-                    ],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 12,
-                            "output": "Successfully checked out develop branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS",
-                            "duration_seconds": 320,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "unit-test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 180,
-                            "output": "All 25 unit tests passed"
-                        },
-                        {
-                            "step": "integration-test",
-                            "status": "FAILED",
-                            "duration_seconds": 323,
-                            "output": "Integration tests failed: 7 passed, 5 failed"
-                        }
-                    ]
-                },
-                {
-                    "run_id": "run-199",
-                    "build_number": 199,
-                    "status": "SUCCESS",
-                    "started_at": "2025-09-16T20:15:10Z",
-                    "completed_at": "2025-09-16T20:29:25Z",
-                    "duration_seconds": 855,
-                    "triggered_by": "scheduler",
-                    "branch": "main",
-                    "commit_hash": "mno345pqr678",
-                    "errors": [],
-                    "steps": [
-                        {
-                            "step": "checkout",
-                            "status": "SUCCESS",
-                            "duration_seconds": 10,
-                            "output": "Successfully checked out main branch"
-                        },
-                        {
-                            "step": "build",
-                            "status": "SUCCESS",
-                            "duration_seconds": 345,
-                            "output": "Build completed successfully"
-                        },
-                        {
-                            "step": "unit-test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 195,
-                            "output": "All 25 unit tests passed"
-                        },
-                        {
-                            "step": "integration-test",
-                            "status": "SUCCESS",
-                            "duration_seconds": 305,
-                            "output": "All 12 integration tests passed"
-                        }
-                    ]
-                }
-            ]
-        }
-    }
+    logs = _LOGS_DATA.get(pipeline_key)
     
     # Return empty structure if pipeline not found
-    if pipeline_key not in logs_data:
+    if logs is None:
         return {
             "pipeline_key": pipeline_key,
             "pipeline_name": f"Unknown Pipeline ({pipeline_key})",
@@ -358,10 +446,10 @@ def get_pipeline_logs(pipeline_key: str) -> Dict[str, Any]:
             "runs": []
         }
     
-    return logs_data[pipeline_key]
+    return logs
 
 
-def get_all_logs(pipelines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_all_logs(pipelines: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
     Get logs for multiple pipelines by mapping each pipeline to its log data.
     
@@ -380,71 +468,66 @@ def get_all_logs(pipelines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         >>> len(logs)
         2
     """
-    logs = []
-    
-    for pipeline in pipelines:
-        # Extract pipeline key from various possible field names
-        pipeline_key = None
-        for key_field in ['key', 'planKey', 'pipeline_key', 'id']:
-            if key_field in pipeline:
-                if isinstance(pipeline[key_field], dict):
-                    # Handle nested key structures like planKey: {key: "PROJ-PLAN1"}
-                    pipeline_key = pipeline[key_field].get('key')
-                else:
-                    pipeline_key = pipeline[key_field]
-                break
-        
-        if pipeline_key:
-            logs.append(get_pipeline_logs(pipeline_key))
-        else:
-            # If no valid key found, create empty log entry
-            logs.append({
-                "pipeline_key": "UNKNOWN",
-                "pipeline_name": "Unknown Pipeline",
-                "total_runs": 0,
-                "runs": [],
-                "error": "No valid pipeline key found in pipeline data"
-            })
-    
-    return logs
+    logs_for = get_pipeline_logs
+    return [
+        logs_for(pipeline_key) if (pipeline_key := _extract_key(pipeline)) else _keyless_logs()
+        for pipeline in pipelines
+    ]
 
 
-def get_error_summary(pipeline_logs: Dict[str, Any]) -> Dict[str, Any]:
+def _extract_key(pipeline: dict[str, Any]) -> Any:
+    """Return the pipeline key from the first populated key field, or None."""
+    for key_field in _KEY_FIELDS:
+        value = pipeline.get(key_field)
+        if value is not None:
+            # Handle nested key structures like planKey: {key: "PROJ-PLAN1"}
+            get = getattr(value, 'get', None)
+            return get('key') if get is not None else value
+    return None
+
+
+def _keyless_logs() -> dict[str, Any]:
+    """Build the empty log entry for a pipeline without a valid key."""
+    return {
+        "pipeline_key": "UNKNOWN",
+        "pipeline_name": "Unknown Pipeline",
+        "total_runs": 0,
+        "runs": [],
+        "error": "No valid pipeline key found in pipeline data"
+    }
+
+
+def get_error_summary(pipeline_logs: dict[str, Any]) -> dict[str, Any]:
     """
     Extract error summary from pipeline logs.
     
+    Summaries of the static logs returned by get_pipeline_logs() are
+    precomputed at import; each call returns a shallow copy, so the error
+    details are shared between calls and must be treated as read-only.
+    
     Args:
         pipeline_logs: Pipeline log data from get_pipeline_logs()
         
     Returns:
         Dict containing error statistics and details
     """
-    total_runs = len(pipeline_logs.get('runs', []))
-    failed_runs = 0
-    total_errors = 0
-    error_details = []
+    pipeline_key = pipeline_logs.get('pipeline_key')
+    if _LOGS_DATA.get(pipeline_key) is pipeline_logs:
+        return dict(_ERROR_SUMMARIES[pipeline_key])
+    return _compute_error_summary(pipeline_logs)
+
+
+def iter_error_details(pipeline_key: str) -> Iterator[ErrorDetail]:
+    """
+    Iterate over the error details of a pipeline without building a list.
     
-    for run in pipeline_logs.get('runs', []):
-        if run.get('status') == 'FAILED':
-            failed_runs += 1
-            run_errors = run.get('errors', [])
-            total_errors += len(run_errors)
-            
-            for error in run_errors:
-                error_details.append({
-                    'run_id': run.get('run_id'),
-                    'build_number': run.get('build_number'),
-                    'step': error.get('step'),
-                    'message': error.get('message'),
-                    'timestamp': run.get('started_at')
-                })
+    Yields the entries of get_error_summary()['error_details'] for the
+    pipeline's static logs as ErrorDetail records, one at a time.
     
-    return {
-        'pipeline_key': pipeline_logs.get('pipeline_key'),
-        'pipeline_name': pipeline_logs.get('pipeline_name'),
-        'total_runs': total_runs,
-        'failed_runs': failed_runs,
-        'success_rate': round((total_runs - failed_runs) / total_runs * 100, 1) if total_runs > 0 else 0.0,
-        'total_errors': total_errors,
-        'error_details': error_details
-    }
\ No newline at end of file
+    Args:
+        pipeline_key: The pipeline key (e.g., 'PROJ-PLAN2')
+        
+    Returns:
+        Iterator of ErrorDetail records; empty for unknown pipelines
+    """
+    return _error_details(_FAILED_RUNS_BY_KEY.get(pipeline_key, ()))
@@ -5,7 +5,10 @@ This module provides the main entry point for running comprehensive pipeline
 analysis, from data collection through AI-powered analysis to executive reporting.
 """
 
+import json
 import logging
+import time
+from functools import lru_cache
 from typing import Dict, List, Any
 from datetime import datetime
 
@@ -14,6 +17,12 @@ from .logs_mock import get_all_logs
 from .analyzer_agent import analyze_multiple_pipelines
 from .reporting_agent import aggregate_and_report
 
+# orjson is optional; it serializes the large workflow result much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging with ERROR as default level
 # This can be overridden by the main application based on verbosity flags
 logging.basicConfig(
@@ -22,6 +31,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# How long the health check may reuse the normalized plan listing
+_HEALTH_CHECK_TTL_SECONDS = 30
+
+# Overall health levels and their emoji, from best to worst
+_HEALTH_LEVELS = (
+    ("excellent", "🟢"),
+    ("good", "🟡"),
+    ("concerning", "🟠"),
+    ("critical", "🔴"),
+)
+
 
 def run(question: str) -> Dict[str, Any]:
     """
@@ -35,7 +55,8 @@ def run(question: str) -> Dict[str, Any]:
         question: User question or context for the analysis (for future extension)
         
     Returns:
-        Dict containing complete workflow results with traceability:
+        Dict containing complete workflow results with traceability (see
+        to_json() for serializing it):
         - workflow_info: Metadata about the execution
         - inputs: All input data used in the analysis
         - processing: Intermediate results from each stage
@@ -60,7 +81,18 @@ def run(question: str) -> Dict[str, Any]:
         # Step 2: Fetch logs for each pipeline (mock data)
         logger.debug("Step 2: Fetching pipeline logs...")
         all_logs = get_all_logs(normalized_plans)
-        total_runs = sum(len(logs.get('runs', [])) for logs in all_logs)
+        
+        # Summarize the logs for traceability in the same pass that counts runs
+        total_runs = 0
+        logs_summary = []
+        for logs in all_logs:
+            runs = logs.get('runs', [])
+            total_runs += len(runs)
+            logs_summary.append({
+                "pipeline_key": logs.get('pipeline_key'),
+                "runs_count": len(runs),
+                "has_errors": any(run.get('errors') for run in runs)
+            })
         logger.debug(f"Retrieved logs for {total_runs} total runs across all pipelines")
         
         # Step 3: Analyze each pipeline via analyzer_agent
@@ -100,14 +132,7 @@ def run(question: str) -> Dict[str, Any]:
                 "step2_logs": {
                     "logs_retrieved": len(all_logs),
                     "total_runs": total_runs,
-                    "logs_summary": [
-                        {
-                            "pipeline_key": logs.get('pipeline_key'),
-                            "runs_count": len(logs.get('runs', [])),
-                            "has_errors": any(run.get('errors', []) for run in logs.get('runs', []))
-                        }
-                        for logs in all_logs
-                    ]
+                    "logs_summary": logs_summary
                 },
                 "step3_analysis": {
                     "analyses_completed": len(analyses),
@@ -166,7 +191,35 @@ def run(question: str) -> Dict[str, Any]:
         }
 
 
-def _normalize_bamboo_plans(raw_bamboo_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def to_json(workflow_result: Dict[str, Any], indent: bool = False) -> bytes:
+    """
+    Serialize a workflow result from run() to UTF-8 JSON.
+    
+    Uses orjson when it is installed and the standard json module otherwise.
+    Timestamps in the result are already ISO strings, so no custom encoder
+    is needed.
+    
+    Args:
+        workflow_result: Result returned by run()
+        indent: Indent nested structures by two spaces instead of emitting
+            compact JSON
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(workflow_result, option=option)
+        except TypeError:
+            # Types orjson does not support; let json handle or report them
+            pass
+    if indent:
+        return json.dumps(workflow_result, indent=2).encode('utf-8')
+    return json.dumps(workflow_result, separators=(',', ':')).encode('utf-8')
+
+
+def _normalize_bamboo_plans(raw_bamboo_data: Dict[str, Any], keep_original: bool = False) -> List[Dict[str, Any]]:
     """
     Normalize Bamboo plans data into consistent format.
     
@@ -175,6 +228,9 @@ def _normalize_bamboo_plans(raw_bamboo_data: Dict[str, Any]) -> List[Dict[str, A
     
     Args:
         raw_bamboo_data: Raw response from get_bamboo_plans()
+        keep_original: Include the raw plan under '_original' in each
+            normalized plan. Off by default, since the workflow result
+            already carries the raw response.
         
     Returns:
         List of normalized plan dictionaries
@@ -194,10 +250,11 @@ def _normalize_bamboo_plans(raw_bamboo_data: Dict[str, Any]) -> List[Dict[str, A
             'isActive': plan.get('isActive', False),
             'isBuilding': plan.get('isBuilding', False),
             'averageBuildTimeInSeconds': plan.get('averageBuildTimeInSeconds', 0),
-            'link': plan.get('link', {}).get('href', ''),
-            # Preserve original for reference
-            '_original': plan
+            'link': plan.get('link', {}).get('href', '')
         }
+        if keep_original:
+            # Preserve original for reference
+            normalized_plan['_original'] = plan
         normalized.append(normalized_plan)
     
     # Sort by key for deterministic ordering
@@ -225,38 +282,33 @@ def _generate_execution_summary(
     """
     stats = report.get('stats', {})
     bugs = report.get('bugs_summary', [])
+    critical_issues = sum(1 for bug in bugs if bug.get('severity') == 'high')
     
-    # Categorize pipelines by health
-    healthy_pipelines = []
-    warning_pipelines = []
-    critical_pipelines = []
+    # Categorize pipelines by health: 0 healthy, 1 warning, 2 critical
+    categories = ([], [], [])
+    healthy_pipelines, warning_pipelines, critical_pipelines = categories
     
     for analysis in analyses:
-        pipeline_key = analysis.get('pipeline_key', 'UNKNOWN')
-        summary = analysis.get('summary', '').lower()
-        top_errors = analysis.get('top_errors', [])
-        
-        if 'excellent' in summary or 'good' in summary or len(top_errors) == 0:
-            healthy_pipelines.append(pipeline_key)
-        elif 'concerning' in summary or len(top_errors) <= 2:
-            warning_pipelines.append(pipeline_key)
+        error_count = len(analysis.get('top_errors', []))
+        if error_count == 0:
+            category = 0
         else:
-            critical_pipelines.append(pipeline_key)
+            summary = analysis.get('summary', '').lower()
+            if 'excellent' in summary or 'good' in summary:
+                category = 0
+            elif error_count <= 2 or 'concerning' in summary:
+                category = 1
+            else:
+                category = 2
+        categories[category].append(analysis.get('pipeline_key', 'UNKNOWN'))
     
-    # Determine overall health
+    # Determine overall health from the warning and critical counts
     total_pipelines = len(analyses)
-    if len(critical_pipelines) == 0 and len(warning_pipelines) <= 1:
-        overall_health = "excellent"
-        health_emoji = "🟢"
-    elif len(critical_pipelines) == 0:
-        overall_health = "good"
-        health_emoji = "🟡"
-    elif len(critical_pipelines) <= 1:
-        overall_health = "concerning"
-        health_emoji = "🟠"
+    if critical_pipelines:
+        level = 3 if len(critical_pipelines) > 1 else 2
     else:
-        overall_health = "critical"
-        health_emoji = "🔴"
+        level = 1 if len(warning_pipelines) > 1 else 0
+    overall_health, health_emoji = _HEALTH_LEVELS[level]
     
     return {
         "overall_health": overall_health,
@@ -265,7 +317,7 @@ def _generate_execution_summary(
         "pipelines_analyzed": total_pipelines,
         "total_runs_analyzed": stats.get('runs_total', 0),
         "total_errors_found": stats.get('errors_total', 0),
-        "critical_issues": len([bug for bug in bugs if bug.get('severity') == 'high']),
+        "critical_issues": critical_issues,
         "pipeline_health_breakdown": {
             "healthy": len(healthy_pipelines),
             "warning": len(warning_pipelines),
@@ -285,7 +337,7 @@ def _generate_execution_summary(
         },
         "quick_summary": f"{health_emoji} {overall_health.title()} - {total_pipelines} pipelines, "
                         f"{stats.get('errors_total', 0)} errors, "
-                        f"{len([bug for bug in bugs if bug.get('severity') == 'high'])} critical issues"
+                        f"{critical_issues} critical issues"
     }
 
 
@@ -329,18 +381,35 @@ def run_quick_health_check() -> str:
     """
     Run a quick health check and return a simple status message.
     
+    Only checks that pipelines can be listed; logs are not fetched and no
+    AI analysis is run, so the check is cheap enough for liveness probes.
+    The normalized plan listing is reused for up to
+    _HEALTH_CHECK_TTL_SECONDS.
+    
     Returns:
         String status message suitable for monitoring
     """
     try:
-        # Quick test of the workflow with minimal data
-        result = run("Health check test")
+        plans = _normalized_plans_cached(int(time.monotonic() // _HEALTH_CHECK_TTL_SECONDS))
         
-        if result.get('workflow_info', {}).get('status') == 'success':
-            stats = result.get('outputs', {}).get('report', {}).get('stats', {})
-            return f"✅ Healthy - {stats.get('pipelines_total', 0)} pipelines analyzed successfully"
+        if plans:
+            return f"✅ Healthy - {len(plans)} pipelines available"
         else:
-            return f"⚠️ Issues detected - {result.get('workflow_info', {}).get('error_message', 'Unknown error')}"
+            return "⚠️ Issues detected - No pipelines found"
             
     except Exception as e:
-        return f"🔴 System error - {str(e)}"
\ No newline at end of file
+        return f"🔴 System error - {str(e)}"
+
+
+@lru_cache(maxsize=1)
+def _normalized_plans_cached(ttl_bucket: int) -> List[Dict[str, Any]]:
+    """
+    Fetch and normalize the Bamboo plans, cached per TTL bucket.
+    
+    Args:
+        ttl_bucket: Current time window; a new window forces a refetch
+        
+    Returns:
+        List of normalized plan dictionaries
+    """
+    return _normalize_bamboo_plans(get_bamboo_plans())
\ No newline at end of file
@@ -6,10 +6,62 @@ human-readable Markdown reports for stakeholders and management.
 """
 
 import os
-from typing import Dict, List, Any
-from statistics import mean
+import re
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Any, NamedTuple, Tuple
 
-from common.azure_ai import llm_text, get_client, AzureAIError
+from common.azure_ai import load_env, llm_text, get_client, AzureAIError
+
+# Error message fragments that raise the severity of a bug
+_HIGH_SEVERITY_KEYWORDS = (
+    'timeout', 'connection', 'database', 'service unavailable',
+    'out of memory', 'disk space', 'network', 'authentication failed'
+)
+_MEDIUM_SEVERITY_KEYWORDS = (
+    'test failed', 'assertion', 'compilation error', 'build failed',
+    'dependency', 'configuration'
+)
+
+# Each keyword list compiled to one alternation, so a message is classified
+# in a single scan instead of one substring search per keyword
+_HIGH_SEVERITY_RE = re.compile('|'.join(map(re.escape, _HIGH_SEVERITY_KEYWORDS)))
+_MEDIUM_SEVERITY_RE = re.compile('|'.join(map(re.escape, _MEDIUM_SEVERITY_KEYWORDS)))
+
+# Icons used for bug severities in the fallback report
+_SEVERITY_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+class _AnalysisView(NamedTuple):
+    """Fields of a pipeline analysis used by the report builders, read once."""
+    key: str
+    summary: str
+    summary_lower: str
+    top_errors: List[Dict[str, Any]]
+    recommendations: List[str]
+
+
+def _analysis_views(analyses: List[Dict[str, Any]]) -> List[_AnalysisView]:
+    """
+    Sort analyses by pipeline key and extract the fields the reports use.
+    
+    Args:
+        analyses: List of pipeline analysis results
+        
+    Returns:
+        List of analysis views in deterministic pipeline key order
+    """
+    views = []
+    for analysis in sorted(analyses, key=lambda x: x.get('pipeline_key', '')):
+        summary = analysis.get('summary', 'No summary available')
+        views.append(_AnalysisView(
+            analysis.get('pipeline_key', 'UNKNOWN'),
+            summary,
+            summary.lower(),
+            analysis.get('top_errors', []),
+            analysis.get('recommendations', [])
+        ))
+    return views
 
 
 def aggregate_and_report(analyses: List[Dict[str, Any]], all_logs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -36,22 +88,19 @@ def aggregate_and_report(analyses: List[Dict[str, Any]], all_logs: List[Dict[str
         >>> print(report['stats']['pipelines_total'])
         3
     """
-    # Ensure deterministic ordering by pipeline_key
-    analyses_sorted = sorted(analyses, key=lambda x: x.get('pipeline_key', ''))
-    all_logs_sorted = sorted(all_logs, key=lambda x: x.get('pipeline_key', ''))
+    # Ensure deterministic ordering by pipeline_key; logs are looked up by key,
+    # so their order does not matter
+    views = _analysis_views(analyses)
     
-    # Compute aggregate statistics
-    stats = _compute_statistics(analyses_sorted, all_logs_sorted)
-    
-    # Extract bugs summary
-    bugs_summary = _extract_bugs_summary(analyses_sorted, all_logs_sorted)
+    # Compute aggregate statistics and extract bugs summary
+    stats, bugs_summary = _aggregate(views, all_logs)
     
     # Generate Markdown report using Azure AI
     try:
-        markdown = _generate_markdown_report(stats, bugs_summary, analyses_sorted)
+        markdown = _generate_markdown_report(stats, bugs_summary, views)
     except (AzureAIError, Exception) as e:
         print(f"AI report generation failed ({e}), using fallback template")
-        markdown = _generate_fallback_report(stats, bugs_summary, analyses_sorted)
+        markdown = _generate_fallback_report(stats, bugs_summary, views)
     
     return {
         "stats": stats,
@@ -60,74 +109,109 @@ def aggregate_and_report(analyses: List[Dict[str, Any]], all_logs: List[Dict[str
     }
 
 
-def _compute_statistics(analyses: List[Dict[str, Any]], all_logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _aggregate(
+    analyses: List[_AnalysisView],
+    all_logs: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
     """
-    Compute aggregate statistics from analyses and logs.
+    Compute aggregate statistics and extract the bugs summary.
+    
+    The logs are walked once, accumulating the statistics while indexing the
+    most recent run of each top error message for the bugs summary.
     
     Args:
-        analyses: Sorted list of pipeline analyses
-        all_logs: Sorted list of pipeline logs
+        analyses: Sorted list of pipeline analysis views
+        all_logs: List of pipeline logs, in any order
         
     Returns:
-        Dict with computed statistics
+        Tuple of (statistics dict, bugs summary list)
     """
-    pipelines_total = len(analyses)
     runs_total = 0
     total_duration = 0
     completed_runs = 0
     errors_total = 0
     
+    # Logs and recent error runs by pipeline key, for the bugs summary
+    logs_by_key = {}
+    
+    # Only the top error messages of each pipeline are looked up in its runs
+    top_messages: Dict[str, set] = {}
+    for analysis in analyses:
+        top_messages.setdefault(analysis.key, set()).update(
+            error.get('message', 'Unknown error') for error in analysis.top_errors
+        )
+    
     # Aggregate data from logs (more detailed than analyses)
     for logs in all_logs:
         runs = logs.get('runs', [])
         runs_total += len(runs)
+        recent_runs = {}
+        pending = set(top_messages.get(logs.get('pipeline_key'), ()))
         
-        for run in runs:
+        for run in runs:  # Runs are typically ordered newest first
+            errors = run.get('errors', [])
+            
             # Count errors
-            errors_total += len(run.get('errors', []))
+            errors_total += len(errors)
             
             # Sum durations for completed runs only
             duration = run.get('duration_seconds', 0)
             if duration > 0:  # Only count completed runs
                 total_duration += duration
                 completed_runs += 1
+            
+            # Stop searching errors once every top error has been found
+            if not pending:
+                continue
+            for error in errors:
+                if isinstance(error, dict):
+                    message, step = error.get('message'), error.get('step', 'Unknown')
+                elif isinstance(error, str):
+                    message, step = error, 'Unknown'
+                else:
+                    continue
+                if message in pending:
+                    pending.discard(message)
+                    recent_runs[message] = (run, step)
+        
+        logs_by_key[logs.get('pipeline_key')] = (logs, recent_runs)
     
     # Calculate average duration (rounded integer)
     avg_duration_seconds = round(total_duration / completed_runs) if completed_runs > 0 else 0
     
-    return {
-        "pipelines_total": pipelines_total,
+    stats = {
+        "pipelines_total": len(analyses),
         "runs_total": runs_total,
         "avg_duration_seconds": avg_duration_seconds,
         "errors_total": errors_total,
         "completed_runs": completed_runs
     }
+    
+    return stats, _extract_bugs_summary(analyses, logs_by_key)
 
 
-def _extract_bugs_summary(analyses: List[Dict[str, Any]], all_logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _extract_bugs_summary(
+    analyses: List[_AnalysisView],
+    logs_by_key: Dict[str, Tuple[Dict[str, Any], Dict[str, Tuple[Dict[str, Any], str]]]]
+) -> List[Dict[str, Any]]:
     """
-    Extract critical bugs and issues from analyses and logs.
+    Extract critical bugs and issues from analyses and indexed logs.
     
     Args:
-        analyses: Sorted list of pipeline analyses
-        all_logs: Sorted list of pipeline logs
+        analyses: Sorted list of pipeline analysis views
+        logs_by_key: Pipeline key mapped to its logs and to the most recent
+            (run, failed step) pair of each error message
         
     Returns:
         List of bug summaries with pipeline context
     """
     bugs_summary = []
     
-    # Create lookup for logs by pipeline key
-    logs_by_key = {logs.get('pipeline_key'): logs for logs in all_logs}
-    
     for analysis in analyses:
-        pipeline_key = analysis.get('pipeline_key', 'UNKNOWN')
-        pipeline_logs = logs_by_key.get(pipeline_key, {})
+        pipeline_key = analysis.key
+        pipeline_logs, recent_runs = logs_by_key.get(pipeline_key, ({}, {}))
         
-        # Extract top errors from analysis
-        top_errors = analysis.get('top_errors', [])
-        
-        for error in top_errors:
+        for error in analysis.top_errors:
             error_message = error.get('message', 'Unknown error')
             error_count = error.get('count', 1)
             
@@ -135,7 +219,7 @@ def _extract_bugs_summary(analyses: List[Dict[str, Any]], all_logs: List[Dict[st
             severity = _determine_error_severity(error_message, error_count)
             
             # Find recent run with this error for context
-            recent_run = _find_recent_error_run(pipeline_logs, error_message)
+            recent_run, failed_step = recent_runs.get(error_message, ({}, 'Unknown'))
             
             bug_entry = {
                 "pipeline_key": pipeline_key,
@@ -143,8 +227,8 @@ def _extract_bugs_summary(analyses: List[Dict[str, Any]], all_logs: List[Dict[st
                 "error_message": error_message,
                 "frequency": error_count,
                 "severity": severity,
-                "last_seen": recent_run.get('started_at', 'Unknown') if recent_run else 'Unknown',
-                "affected_step": recent_run.get('failed_step', 'Unknown') if recent_run else 'Unknown'
+                "last_seen": recent_run.get('started_at', 'Unknown'),
+                "affected_step": failed_step
             }
             
             bugs_summary.append(bug_entry)
@@ -159,10 +243,14 @@ def _extract_bugs_summary(analyses: List[Dict[str, Any]], all_logs: List[Dict[st
     return bugs_summary
 
 
+@lru_cache(maxsize=2048)
 def _determine_error_severity(error_message: str, frequency: int) -> str:
     """
     Determine error severity based on message content and frequency.
     
+    Results are memoized, since the same error messages recur across runs
+    and pipelines.
+    
     Args:
         error_message: The error message text
         frequency: How often this error occurs
@@ -172,58 +260,18 @@ def _determine_error_severity(error_message: str, frequency: int) -> str:
     """
     error_lower = error_message.lower()
     
-    # High severity indicators
-    high_severity_keywords = [
-        'timeout', 'connection', 'database', 'service unavailable',
-        'out of memory', 'disk space', 'network', 'authentication failed'
-    ]
-    
-    # Medium severity indicators
-    medium_severity_keywords = [
-        'test failed', 'assertion', 'compilation error', 'build failed',
-        'dependency', 'configuration'
-    ]
-    
-    if frequency >= 3 or any(keyword in error_lower for keyword in high_severity_keywords):
+    if frequency >= 3 or _HIGH_SEVERITY_RE.search(error_lower):
         return 'high'
-    elif frequency >= 2 or any(keyword in error_lower for keyword in medium_severity_keywords):
+    elif frequency >= 2 or _MEDIUM_SEVERITY_RE.search(error_lower):
         return 'medium'
     else:
         return 'low'
 
 
-def _find_recent_error_run(pipeline_logs: Dict[str, Any], error_message: str) -> Dict[str, Any]:
-    """
-    Find the most recent run that contains the specified error.
-    
-    Args:
-        pipeline_logs: Pipeline log data
-        error_message: Error message to search for
-        
-    Returns:
-        Most recent run dict containing the error, or empty dict
-    """
-    runs = pipeline_logs.get('runs', [])
-    
-    for run in runs:  # Runs are typically ordered newest first
-        for error in run.get('errors', []):
-            if isinstance(error, dict):
-                if error.get('message') == error_message:
-                    # Add failed step info if available
-                    failed_step = error.get('step', 'Unknown')
-                    run_copy = run.copy()
-                    run_copy['failed_step'] = failed_step
-                    return run_copy
-            elif isinstance(error, str) and error == error_message:
-                return run
-    
-    return {}
-
-
 def _generate_markdown_report(
     stats: Dict[str, Any], 
     bugs_summary: List[Dict[str, Any]], 
-    analyses: List[Dict[str, Any]]
+    analyses: List[_AnalysisView]
 ) -> str:
     """
     Generate human-readable Markdown report using Azure AI.
@@ -231,7 +279,7 @@ def _generate_markdown_report(
     Args:
         stats: Aggregated statistics
         bugs_summary: Critical bugs and issues
-        analyses: Pipeline analysis results
+        analyses: Sorted pipeline analysis views
         
     Returns:
         Markdown formatted report string
@@ -258,14 +306,10 @@ CRITICAL ISSUES ({len(bugs_summary)} total):
     
     data_summary += "\nPIPELINE ANALYSIS SUMMARIES:\n"
     for analysis in analyses:
-        pipeline_key = analysis.get('pipeline_key', 'UNKNOWN')
-        summary = analysis.get('summary', 'No summary available')
-        recommendations = analysis.get('recommendations', [])
-        
-        data_summary += f"\n{pipeline_key}:\n"
-        data_summary += f"  Summary: {summary}\n"
-        if recommendations:
-            data_summary += f"  Key Recommendations: {'; '.join(recommendations[:2])}\n"
+        data_summary += f"\n{analysis.key}:\n"
+        data_summary += f"  Summary: {analysis.summary}\n"
+        if analysis.recommendations:
+            data_summary += f"  Key Recommendations: {'; '.join(analysis.recommendations[:2])}\n"
     
     user_prompt = f"""Create a comprehensive CI/CD Pipeline Report based on this data:
 
@@ -282,6 +326,8 @@ Use professional tone suitable for engineering leadership. Include specific metr
     
     # Try to use the reporting assistant if available
     try:
+        # The id may come from .env, which is otherwise loaded only by the client
+        load_env()
         reporting_assistant_id = os.getenv("AZURE_REPORTING_ASSISTANT_ID")
         if reporting_assistant_id:
             # Use specific reporting assistant
@@ -303,17 +349,13 @@ Use professional tone suitable for engineering leadership. Include specific metr
     if not markdown_report.strip().endswith('\n'):
         markdown_report += '\n'
     
-    return markdown_report    # Ensure the report ends properly
-    if not markdown_report.strip().endswith('\n'):
-        markdown_report += '\n'
-    
     return markdown_report
 
 
 def _generate_fallback_report(
     stats: Dict[str, Any], 
     bugs_summary: List[Dict[str, Any]], 
-    analyses: List[Dict[str, Any]]
+    analyses: List[_AnalysisView]
 ) -> str:
     """
     Generate fallback Markdown report when AI service is unavailable.
@@ -321,14 +363,14 @@ def _generate_fallback_report(
     Args:
         stats: Aggregated statistics
         bugs_summary: Critical bugs and issues
-        analyses: Pipeline analysis results
+        analyses: Sorted pipeline analysis views
         
     Returns:
         Basic Markdown formatted report
     """
     avg_minutes = stats['avg_duration_seconds'] // 60
     
-    report = f"""# CI/CD Pipeline Report
+    parts = [f"""# CI/CD Pipeline Report
 *Generated on {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 
 ## Executive Summary
@@ -350,42 +392,39 @@ Analysis of **{stats['pipelines_total']} pipelines** with **{stats['runs_total']
 
 ## Critical Issues
 
-"""
+"""]
     
     if bugs_summary:
-        report += f"Found **{len(bugs_summary)} critical issues** requiring attention:\n\n"
+        parts.append(f"Found **{len(bugs_summary)} critical issues** requiring attention:\n\n")
         
         for i, bug in enumerate(bugs_summary[:5], 1):
-            severity_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(bug['severity'], "⚪")
-            report += f"{i}. {severity_icon} **{bug['pipeline_key']}**: {bug['error_message']}\n"
-            report += f"   - Frequency: {bug['frequency']} occurrences\n"
-            report += f"   - Severity: {bug['severity'].title()}\n\n"
+            severity_icon = _SEVERITY_ICONS.get(bug['severity'], "⚪")
+            parts.append(
+                f"{i}. {severity_icon} **{bug['pipeline_key']}**: {bug['error_message']}\n"
+                f"   - Frequency: {bug['frequency']} occurrences\n"
+                f"   - Severity: {bug['severity'].title()}\n\n"
+            )
     else:
-        report += "No critical issues detected. ✅\n\n"
-    
-    report += "## Recommendations\n\n"
+        parts.append("No critical issues detected. ✅\n\n")
     
-    # Extract unique recommendations
-    all_recommendations = []
-    for analysis in analyses:
-        all_recommendations.extend(analysis.get('recommendations', []))
+    parts.append("## Recommendations\n\n")
     
-    unique_recommendations = list(dict.fromkeys(all_recommendations))  # Preserve order, remove duplicates
+    # Extract unique recommendations, preserving first-seen order
+    unique_recommendations = list(dict.fromkeys(
+        chain.from_iterable(analysis.recommendations for analysis in analyses)
+    ))
     
     if unique_recommendations:
         for i, rec in enumerate(unique_recommendations[:5], 1):
-            report += f"{i}. {rec}\n"
+            parts.append(f"{i}. {rec}\n")
     else:
-        report += "Continue monitoring pipeline performance and maintain current practices.\n"
+        parts.append("Continue monitoring pipeline performance and maintain current practices.\n")
     
-    report += "\n## Individual Pipeline Status\n\n"
+    parts.append("\n## Individual Pipeline Status\n\n")
     
     for analysis in analyses:
-        pipeline_key = analysis.get('pipeline_key', 'UNKNOWN')
-        summary = analysis.get('summary', 'No summary available')
-        
         # Determine status icon based on summary keywords
-        summary_lower = summary.lower()
+        summary_lower = analysis.summary_lower
         if 'excellent' in summary_lower or 'good' in summary_lower:
             status_icon = "✅"
         elif 'concerning' in summary_lower or 'poor' in summary_lower:
@@ -393,11 +432,11 @@ Analysis of **{stats['pipelines_total']} pipelines** with **{stats['runs_total']
         else:
             status_icon = "ℹ️"
         
-        report += f"### {status_icon} {pipeline_key}\n{summary}\n\n"
+        parts.append(f"### {status_icon} {analysis.key}\n{analysis.summary}\n\n")
     
-    report += "---\n*Report generated automatically by Pipeline Assistant*\n"
+    parts.append("---\n*Report generated automatically by Pipeline Assistant*\n")
     
-    return report
+    return "".join(parts)
 
 
 def generate_daily_summary(analyses: List[Dict[str, Any]], all_logs: List[Dict[str, Any]]) -> str:
@@ -411,8 +450,7 @@ def generate_daily_summary(analyses: List[Dict[str, Any]], all_logs: List[Dict[s
     Returns:
         Short summary string
     """
-    stats = _compute_statistics(analyses, all_logs)
-    bugs_summary = _extract_bugs_summary(analyses, all_logs)
+    stats, bugs_summary = _aggregate(_analysis_views(analyses), all_logs)
     
     success_rate = ((stats['completed_runs'] - stats['errors_total']) / max(stats['completed_runs'], 1) * 100)
     high_severity_issues = sum(1 for bug in bugs_summary if bug['severity'] == 'high')
@@ -0,0 +1,274 @@
+"""
+Tests for the analyzer agent's heuristic fallback and fleet summary.
+
+These paths run without any LLM access, so they are tested directly
+against the deterministic mock pipeline logs.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from common.azure_ai import AzureAIError
+from services import analyzer_agent
+from services.analyzer_agent import (
+    _heuristic_analysis, _summarize_for_llm, analyze_multiple_pipelines, analyze_pipeline_logs,
+    get_fleet_summary
+)
+from services.logs_mock import get_pipeline_logs
+
+
+class TestHeuristicAnalysis:
+    """Test heuristic analysis used when the AI service is unavailable."""
+
+    def test_healthy_pipeline(self):
+        """Test analysis of an all-success pipeline."""
+        analysis = _heuristic_analysis(get_pipeline_logs("PROJ-PLAN1"))
+
+        assert analysis == {
+            'pipeline_key': 'PROJ-PLAN1',
+            'summary': "Pipeline shows excellent health with 100.0% success rate (3/3 runs). "
+                       "Average execution time is 7 minutes.",
+            'top_errors': [],
+            'recommendations': ['Pipeline performing well, continue monitoring']
+        }
+
+    def test_failing_test_pipeline(self):
+        """Test analysis of a pipeline with test failures."""
+        analysis = _heuristic_analysis(get_pipeline_logs("PROJ-PLAN2"))
+
+        assert analysis['summary'] == (
+            "Pipeline shows concerning health with 50.0% success rate (1/2 runs). "
+            "Average execution time is 2 minutes. 1 recent failures requiring attention."
+        )
+        assert analysis['top_errors'] == [
+            {'message': "Test 'test_user_validation' failed: AssertionError: Expected 'valid' but got 'invalid'",
+             'count': 1},
+            {'message': '1 out of 3 tests failed', 'count': 1},
+        ]
+        assert analysis['recommendations'] == [
+            'Investigate recurring failures to improve pipeline stability',
+            'Address top error patterns to reduce failure rate',
+            'Focus on test stability and test environment configuration',
+        ]
+
+    def test_infrastructure_failure_pipeline(self):
+        """Test analysis of a pipeline with in-progress runs and infrastructure errors."""
+        analysis = _heuristic_analysis(get_pipeline_logs("PROJ-PLAN3"))
+
+        assert analysis['summary'].startswith("Pipeline shows poor health with 33.3% success rate (1/3 runs)")
+        assert [error['message'] for error in analysis['top_errors']] == [
+            'Database connection timeout: Unable to connect to test database after 30 seconds',
+            "Service 'user-service' failed health check: HTTP 503 Service Unavailable",
+            'Integration test suite failed: 5 out of 12 tests failed due to service dependencies',
+        ]
+        assert analysis['recommendations'] == [
+            'Investigate recurring failures to improve pipeline stability',
+            'Address top error patterns to reduce failure rate',
+            'Monitor currently running builds for potential issues',
+            'Review timeout configurations and resource allocation',
+            'Focus on test stability and test environment configuration',
+        ]
+
+    def test_no_runs(self):
+        """Test analysis of a pipeline without execution data."""
+        analysis = _heuristic_analysis(get_pipeline_logs("UNKNOWN-PLAN"))
+
+        assert analysis['top_errors'] == []
+        assert analysis['recommendations'] == ['Configure pipeline to capture execution logs']
+
+    def test_error_pattern_recommendations(self):
+        """Test recommendations derived from keywords in error messages."""
+        logs = {
+            'pipeline_key': 'PROJ-X',
+            'runs': [
+                {'status': 'SUCCESS', 'duration_seconds': 60, 'errors': []},
+                {'status': 'SUCCESS', 'duration_seconds': 60, 'errors': ['Request TIMEOUT after 30s']},
+                {'status': 'SUCCESS', 'duration_seconds': 60, 'errors': [{'message': 'Network unreachable'}]},
+                {'status': 'SUCCESS', 'duration_seconds': 60, 'errors': [{'step': 'deploy'}]},
+            ]
+        }
+
+        recommendations = _heuristic_analysis(logs)['recommendations']
+
+        assert 'Review timeout configurations and resource allocation' in recommendations
+        assert 'Investigate network connectivity and service dependencies' in recommendations
+        assert 'Focus on test stability and test environment configuration' not in recommendations
+
+
+class TestSummarizeForLlm:
+    """Test the log digest sent to the LLM in place of the full logs."""
+
+    def test_digest(self):
+        """Test aggregate statistics for a pipeline with mixed results."""
+        digest = _summarize_for_llm(get_pipeline_logs("PROJ-PLAN3"))
+
+        assert digest == {
+            'pipeline_key': 'PROJ-PLAN3',
+            'pipeline_name': 'Project Gamma - Integration Tests',
+            'run_count': 3,
+            'status_counts': {'IN_PROGRESS': 1, 'FAILED': 1, 'SUCCESS': 1},
+            'top_error_messages': [
+                {'message': 'Database connection timeout: Unable to connect to test database after 30 seconds',
+                 'count': 1},
+                {'message': "Service 'user-service' failed health check: HTTP 503 Service Unavailable",
+                 'count': 1},
+                {'message': 'Integration test suite failed: 5 out of 12 tests failed due to service dependencies',
+                 'count': 1},
+            ],
+            'duration_percentiles': {'p50': 835, 'p90': 835, 'max': 855}
+        }
+
+    def test_digest_without_runs(self):
+        """Test digest of a pipeline without execution data."""
+        digest = _summarize_for_llm(get_pipeline_logs("UNKNOWN-PLAN"))
+
+        assert digest['run_count'] == 0
+        assert digest['top_error_messages'] == []
+        assert digest['duration_percentiles'] == {}
+
+
+class TestAnalyzePipelineLogs:
+    """Test validation of LLM analysis responses."""
+
+    @pytest.fixture
+    def llm_json(self, monkeypatch):
+        """Chat-completions client whose llm_json response can be set per test."""
+        monkeypatch.setattr(analyzer_agent, "get_client", lambda: MagicMock(assistant_id=None))
+        mock = MagicMock()
+        monkeypatch.setattr(analyzer_agent, "llm_json", mock)
+        return mock
+
+    def test_malformed_entries_normalized(self, llm_json):
+        """Test that error entries are coerced and the pipeline key is enforced."""
+        llm_json.return_value = {
+            'pipeline_key': 'WRONG-KEY',
+            'summary': 'Mostly healthy',
+            'top_errors': ['Disk full', {'message': 'Timeout'}, {'count': 3}],
+            'recommendations': 'not a list'
+        }
+
+        analysis = analyze_pipeline_logs(get_pipeline_logs("PROJ-PLAN1"))
+
+        assert analysis == {
+            'pipeline_key': 'PROJ-PLAN1',
+            'summary': 'Mostly healthy',
+            'top_errors': [
+                {'message': 'Disk full', 'count': 1},
+                {'message': 'Timeout', 'count': 1},
+                {'message': 'Unknown error', 'count': 3},
+            ],
+            'recommendations': []
+        }
+
+    def test_missing_keys_fall_back_to_heuristics(self, llm_json):
+        """Test that an incomplete response triggers the heuristic fallback."""
+        llm_json.return_value = {'summary': 'Incomplete'}
+        logs = get_pipeline_logs("PROJ-PLAN2")
+
+        assert analyze_pipeline_logs(logs) == _heuristic_analysis(logs)
+
+
+    @pytest.mark.parametrize("response_text", [
+        '{"pipeline_key": "X", "summary": "ok", "top_errors": [], "recommendations": []}',
+        'Result:\n```json\n{"pipeline_key": "X", "summary": "ok", "top_errors": [], "recommendations": []}\n```',
+    ])
+    def test_assistant_response_parsed(self, monkeypatch, response_text):
+        """Test bare and fenced JSON responses from an assistant."""
+        client = MagicMock(assistant_id="asst_mock")
+        client.llm_text_with_assistant.return_value = response_text
+        monkeypatch.setattr(analyzer_agent, "get_client", lambda: client)
+
+        analysis = analyze_pipeline_logs(get_pipeline_logs("PROJ-PLAN1"))
+
+        assert analysis == {'pipeline_key': 'PROJ-PLAN1', 'summary': 'ok', 'top_errors': [], 'recommendations': []}
+
+
+class TestAnalyzeMultiplePipelines:
+    """Test batch analysis of several pipelines."""
+
+    def test_unconfigured_client_resolved_once(self, monkeypatch):
+        """Test that a missing configuration is detected once per batch, not per pipeline."""
+        calls = []
+
+        def failing_get_client():
+            calls.append(1)
+            raise AzureAIError("Missing required Azure AI configuration")
+
+        monkeypatch.setattr(analyzer_agent, "get_client", failing_get_client)
+        all_logs = [get_pipeline_logs(key) for key in ("PROJ-PLAN1", "PROJ-PLAN2", "PROJ-PLAN3")]
+
+        analyses = analyze_multiple_pipelines(all_logs)
+
+        assert len(calls) == 1
+        assert analyses == [_heuristic_analysis(logs) for logs in all_logs]
+
+    def test_empty_input(self):
+        """Test that no pipelines yields no analyses."""
+        assert analyze_multiple_pipelines([]) == []
+
+
+class TestFleetSummary:
+    """Test fleet-wide aggregation of pipeline analyses."""
+
+    @pytest.fixture
+    def analyses(self):
+        """Analyses with shared errors and recommendations across pipelines."""
+        return [
+            {
+                'pipeline_key': 'PROJ-A',
+                'summary': 'Pipeline shows excellent health',
+                'top_errors': [],
+                'recommendations': ['Pipeline performing well, continue monitoring']
+            },
+            {
+                'pipeline_key': 'PROJ-B',
+                'summary': 'Pipeline shows poor health with 2 recent failures',
+                'top_errors': [{'message': 'Database connection timeout', 'count': 2}],
+                'recommendations': ['Review timeout configurations', 'Investigate recurring failures']
+            },
+            {
+                'pipeline_key': 'PROJ-C',
+                'summary': 'Pipeline shows concerning health',
+                'top_errors': [
+                    {'message': 'Database connection timeout', 'count': 1},
+                    {'message': 'Test failed', 'count': 1}
+                ],
+                'recommendations': ['Review timeout configurations']
+            },
+        ]
+
+    def test_fleet_summary(self, analyses):
+        """Test common issues, recommendations and overall health."""
+        summary = get_fleet_summary(analyses)
+
+        assert summary == {
+            'total_pipelines': 3,
+            'overall_health': 'concerning',
+            'common_issues': [{'issue': 'Database connection timeout', 'affected_pipelines': 2}],
+            'fleet_recommendations': ['Review timeout configurations']
+        }
+
+    def test_healthy_fleet(self, analyses):
+        """Test that a fleet of healthy pipelines is reported as good."""
+        healthy = [dict(analyses[0], pipeline_key=key) for key in ('PROJ-A', 'PROJ-B')]
+
+        summary = get_fleet_summary(healthy)
+
+        assert summary['overall_health'] == 'good'
+        assert summary['common_issues'] == []
+        assert summary['fleet_recommendations'] == ['Pipeline performing well, continue monitoring']
+
+    def test_empty_fleet(self):
+        """Test summary of an empty fleet."""
+        assert get_fleet_summary([])['overall_health'] == 'unknown'
+
+    def test_health_keywords_match_whole_words(self, analyses):
+        """Test that health keywords ignore punctuation and partial words."""
+        fleet = [
+            dict(analyses[0], summary='Overall the pipeline is good.'),
+            dict(analyses[0], summary='Pipeline is performing well, with no failures'),
+            dict(analyses[0], summary='Builds are goodish but need review'),
+        ]
+
+        # "goodish" is neutral, so two healthy summaries out of three score as good
+        assert get_fleet_summary(fleet)['overall_health'] == 'good'
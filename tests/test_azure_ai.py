@@ -0,0 +1,154 @@
+"""
+Tests for the Azure AI client wrapper.
+
+Exercises the HTTP-level behaviour of AzureAIClient with the underlying
+httpx client mocked out, so no network access or credentials are required.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from common.azure_ai import AzureAIClient, AzureAIError, JSONParseError, ensure_json
+
+
+def _completion_response(content: str) -> MagicMock:
+    """Build a mocked successful chat completion response."""
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps({"choices": [{"message": {"content": content}}]}).encode()
+    return response
+
+
+def _json_response(body: dict, status_code: int = 200) -> MagicMock:
+    """Build a mocked HTTP response with a JSON body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(body).encode()
+    response.headers = {}
+    return response
+
+
+class TestEnsureJson:
+    """Test JSON extraction from model responses."""
+
+    @pytest.mark.parametrize("response_text", [
+        '{"status": "ok"}',
+        '  {"status": "ok"}\n',
+        '```json\n{"status": "ok"}\n```',
+        '```\n{"status": "ok"}\n```',
+        '```json{"status": "ok"}```',
+        'Here is the result:\n```json\n{"status": "ok"}\n```\nLet me know!',
+        '```json\n{"status": "ok"}\n```\n\n```json\n{"status": "other"}\n```',
+    ])
+    def test_extracts_json(self, response_text):
+        """Test plain, fenced and embedded JSON responses."""
+        assert ensure_json(response_text) == {"status": "ok"}
+
+    def test_invalid_json_raises(self):
+        """Test that unparseable content raises JSONParseError."""
+        with pytest.raises(JSONParseError):
+            ensure_json("```json\nnot json\n```")
+
+
+class TestAzureAIClientCache:
+    """Test the content-addressed response cache."""
+
+    @pytest.fixture
+    def client(self):
+        """Client with explicit configuration and a mocked HTTP transport."""
+        client = AzureAIClient(
+            endpoint="https://mock.openai.azure.com",
+            api_key="mock-api-key",
+            deployment="mock-gpt-4",
+            cache_size=2
+        )
+        client.client = MagicMock()
+        client.client.post.return_value = _completion_response("cached answer")
+        return client
+
+    def test_identical_requests_hit_cache(self, client):
+        """Test that a repeated prompt does not issue a second HTTP request."""
+        first = client.llm_text("system", "user")
+        second = client.llm_text("system", "user")
+
+        assert first == second == "cached answer"
+        assert client.client.post.call_count == 1
+
+    def test_different_requests_miss_cache(self, client):
+        """Test that distinct prompts are sent separately."""
+        client.llm_text("system", "first question")
+        client.llm_text("system", "second question")
+
+        assert client.client.post.call_count == 2
+
+    def test_cache_evicts_least_recently_used(self, client):
+        """Test that the cache stays within its configured size."""
+        for question in ["one", "two", "three"]:
+            client.llm_text("system", question)
+
+        assert len(client._cache) == 2
+
+        # "one" was evicted and must be fetched again
+        client.llm_text("system", "one")
+        assert client.client.post.call_count == 4
+
+    def test_cache_disabled(self, client):
+        """Test that caching can be turned off per client."""
+        client.cache_enabled = False
+
+        client.llm_text("system", "user")
+        client.llm_text("system", "user")
+
+        assert client.client.post.call_count == 2
+
+
+class TestAzureAIClientAssistantHttp:
+    """Test the HTTP fallback for assistant runs."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Assistant-enabled client without the Azure AI Projects SDK."""
+        monkeypatch.setattr("common.azure_ai._load_azure_sdk", lambda: False)
+        client = AzureAIClient(
+            endpoint="https://mock.openai.azure.com/",
+            api_key="mock-api-key",
+            deployment="mock-gpt-4",
+            assistant_id="asst_mock"
+        )
+        client.client = MagicMock()
+        return client
+
+    def test_thread_and_run_created_in_one_request(self, client):
+        """Test that the thread, message and run are created with a single POST."""
+        client.client.post.return_value = _json_response({"id": "run_1", "thread_id": "thread_1"})
+        client.client.get.side_effect = [
+            _json_response({"status": "completed"}),
+            _json_response({"data": [
+                {"role": "assistant", "content": [{"text": {"value": "assistant answer"}}]}
+            ]}),
+        ]
+
+        answer = client.llm_text_with_assistant("user prompt", "system prompt")
+
+        assert answer == "assistant answer"
+        assert client.client.post.call_count == 1
+
+        url = client.client.post.call_args.args[0]
+        body = client.client.post.call_args.kwargs["json"]
+        assert url.startswith("https://mock.openai.azure.com/openai/threads/runs?")
+        assert body["assistant_id"] == "asst_mock"
+        assert body["thread"]["messages"] == [{"role": "user", "content": "user prompt"}]
+        assert body["additional_instructions"] == "system prompt"
+
+        # Only the newest message is requested once the run completes
+        messages_call = client.client.get.call_args_list[-1]
+        assert messages_call.kwargs["params"] == {"order": "desc", "limit": 1}
+
+    def test_failed_run_raises(self, client):
+        """Test that a failed run surfaces as an AzureAIError."""
+        client.client.post.return_value = _json_response({"id": "run_1", "thread_id": "thread_1"})
+        client.client.get.return_value = _json_response({"status": "failed"})
+
+        with pytest.raises(AzureAIError, match="failed"):
+            client.llm_text_with_assistant("user prompt")
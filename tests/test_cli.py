@@ -0,0 +1,33 @@
+"""
+Tests for the CLI configuration check.
+
+The required Azure variables are read from the environment when the
+check runs, so configuration set after import is honoured.
+"""
+
+import pytest
+
+from foundry_pipeline_assistant import _REQUIRED_VARS, validate_azure_config
+
+
+class TestValidateAzureConfig:
+    """Test validation of the required Azure AI environment variables."""
+
+    def test_config_set_after_import(self, monkeypatch):
+        """Test that variables set at runtime satisfy the check."""
+        for var in _REQUIRED_VARS:
+            monkeypatch.setenv(var, "configured")
+
+        validate_azure_config()
+
+    def test_missing_variable_exits(self, monkeypatch, capsys):
+        """Test that a variable removed at runtime is reported as missing."""
+        for var in _REQUIRED_VARS:
+            monkeypatch.setenv(var, "configured")
+        monkeypatch.delenv("AZURE_OPENAI_API_KEY")
+
+        with pytest.raises(SystemExit) as excinfo:
+            validate_azure_config()
+
+        assert excinfo.value.code == 1
+        assert "Missing required environment variables: AZURE_OPENAI_API_KEY" in capsys.readouterr().err
@@ -0,0 +1,143 @@
+"""
+Tests for the reporting agent's deterministic helpers.
+
+These helpers run without any LLM access, so they are tested directly
+against the mock pipeline logs and their heuristic analyses.
+"""
+
+import pytest
+
+from services.analyzer_agent import _heuristic_analysis
+from services.logs_mock import get_all_logs
+from services.reporting_agent import (
+    _aggregate, _analysis_views, _determine_error_severity, _generate_fallback_report
+)
+
+
+@pytest.fixture
+def all_logs():
+    """Logs for the three mock pipelines."""
+    return get_all_logs([{'key': 'PROJ-PLAN1'}, {'key': 'PROJ-PLAN2'}, {'key': 'PROJ-PLAN3'}])
+
+
+@pytest.fixture
+def analyses(all_logs):
+    """Report views of the heuristic analyses of the three mock pipelines."""
+    return _analysis_views([_heuristic_analysis(logs) for logs in all_logs])
+
+
+class TestDetermineErrorSeverity:
+    """Test keyword and frequency based severity classification."""
+
+    @pytest.mark.parametrize("message, frequency, severity", [
+        ("Database connection timeout", 1, 'high'),
+        ("HTTP 503 Service Unavailable", 1, 'high'),
+        ("AssertionError: expected 'valid'", 1, 'medium'),
+        ("Build failed: missing dependency", 1, 'medium'),
+        ("Lint warning", 1, 'low'),
+        ("Lint warning", 2, 'medium'),
+        ("Lint warning", 3, 'high'),
+    ])
+    def test_severity(self, message, frequency, severity):
+        """Test severity for keyword matches and repeated errors."""
+        assert _determine_error_severity(message, frequency) == severity
+
+
+class TestAnalysisViews:
+    """Test the per-analysis records shared by the report builders."""
+
+    def test_sorted_with_defaults(self):
+        """Test key ordering and the defaults for missing fields."""
+        views = _analysis_views([
+            {'pipeline_key': 'PROJ-B', 'summary': 'Pipeline shows GOOD health'},
+            {'pipeline_key': 'PROJ-A', 'top_errors': [{'message': 'Disk full', 'count': 1}]},
+        ])
+
+        assert [view.key for view in views] == ['PROJ-A', 'PROJ-B']
+        assert views[0].summary == 'No summary available'
+        assert views[0].recommendations == []
+        assert views[1].summary_lower == 'pipeline shows good health'
+
+
+class TestAggregate:
+    """Test statistics and bug extraction from analyses and logs."""
+
+    def test_statistics(self, analyses, all_logs):
+        """Test run, duration and error totals across the mock pipelines."""
+        stats, _ = _aggregate(analyses, all_logs)
+
+        assert stats == {
+            'pipelines_total': 3,
+            'runs_total': 8,
+            'avg_duration_seconds': 471,
+            'errors_total': 5,
+            'completed_runs': 7
+        }
+
+    def test_bugs_carry_recent_run_context(self, analyses, all_logs):
+        """Test that each bug reports the latest run and step it occurred in."""
+        _, bugs = _aggregate(analyses, all_logs)
+
+        assert [(bug['pipeline_key'], bug['severity']) for bug in bugs] == [
+            ('PROJ-PLAN3', 'high'),
+            ('PROJ-PLAN3', 'high'),
+            ('PROJ-PLAN2', 'medium'),
+            ('PROJ-PLAN2', 'low'),
+            ('PROJ-PLAN3', 'low'),
+        ]
+        assert bugs[0] == {
+            'pipeline_key': 'PROJ-PLAN3',
+            'pipeline_name': 'Project Gamma - Integration Tests',
+            'error_message': 'Database connection timeout: Unable to connect to test database after 30 seconds',
+            'frequency': 1,
+            'severity': 'high',
+            'last_seen': '2025-09-17T08:30:20Z',
+            'affected_step': 'integration-test'
+        }
+
+    def test_string_errors_and_unmatched_messages(self):
+        """Test plain-string errors and errors missing from the logs."""
+        logs = {
+            'pipeline_key': 'PROJ-X',
+            'pipeline_name': 'Pipeline X',
+            'runs': [
+                {'started_at': '2025-01-02T00:00:00Z', 'errors': ['Disk full']},
+                {'started_at': '2025-01-01T00:00:00Z', 'errors': ['Disk full']},
+            ]
+        }
+        analysis = {
+            'pipeline_key': 'PROJ-X',
+            'top_errors': [{'message': 'Disk full', 'count': 2}, {'message': 'Never logged', 'count': 1}]
+        }
+
+        _, (disk_full, never_logged) = _aggregate(_analysis_views([analysis]), [logs])
+
+        assert (disk_full['last_seen'], disk_full['affected_step']) == ('2025-01-02T00:00:00Z', 'Unknown')
+        assert (never_logged['last_seen'], never_logged['affected_step']) == ('Unknown', 'Unknown')
+
+
+class TestFallbackReport:
+    """Test the template report used when the AI service is unavailable."""
+
+    def test_report_sections(self, analyses, all_logs):
+        """Test that the report lists issues, recommendations and pipeline status."""
+        stats, bugs = _aggregate(analyses, all_logs)
+
+        report = _generate_fallback_report(stats, bugs, analyses)
+
+        assert report.startswith("# CI/CD Pipeline Report\n")
+        assert "Found **5 critical issues** requiring attention:" in report
+        assert "1. 🔴 **PROJ-PLAN3**: Database connection timeout" in report
+        assert "1. Pipeline performing well, continue monitoring\n" in report
+        assert "### ✅ PROJ-PLAN1\n" in report
+        assert "### ⚠️ PROJ-PLAN3\n" in report
+        assert report.endswith("*Report generated automatically by Pipeline Assistant*\n")
+
+    def test_report_without_issues(self, all_logs):
+        """Test the placeholders used when there are no bugs or recommendations."""
+        stats, _ = _aggregate([], all_logs)
+
+        report = _generate_fallback_report(stats, [], [])
+
+        assert "No critical issues detected. ✅" in report
+        assert "Continue monitoring pipeline performance" in report
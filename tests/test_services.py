@@ -5,20 +5,39 @@ Tests the deterministic mock data generation and normalization functions
 to ensure consistent test data and proper data structure transformations.
 """
 
+import json
 import pytest
+from dataclasses import asdict
+from types import MappingProxyType
 from typing import Dict, List, Any
 
-from services.bamboo_mock import get_bamboo_plans, get_plan_results
-from services.logs_mock import get_pipeline_logs, get_all_logs, get_error_summary
+from services.bamboo_mock import (
+    get_bamboo_plans, get_bamboo_plans_objects, list_plan_keys, list_enabled_plan_keys, get_plan, get_plan_results
+)
+from services.logs_mock import (
+    ErrorDetail, get_pipeline_logs, get_all_logs, get_error_summary, iter_error_details
+)
 from services.orchestrator import _normalize_bamboo_plans
 
 
+@pytest.fixture(scope="module")
+def bamboo_plans():
+    """Raw Bamboo plans response shared by the module."""
+    return get_bamboo_plans()
+
+
+@pytest.fixture(scope="module")
+def normalized_plans(bamboo_plans):
+    """Normalized Bamboo plans shared by the module."""
+    return _normalize_bamboo_plans(bamboo_plans)
+
+
 class TestBambooMockNormalization:
     """Test bamboo mock data and normalization functions."""
     
-    def test_get_bamboo_plans_structure(self):
+    def test_get_bamboo_plans_structure(self, bamboo_plans):
         """Test that bamboo plans have expected structure."""
-        plans = get_bamboo_plans()
+        plans = bamboo_plans
         
         # Check top-level structure
         assert 'plans' in plans
@@ -34,11 +53,10 @@ class TestBambooMockNormalization:
             assert 'link' in plan
             assert isinstance(plan['enabled'], bool)
     
-    def test_normalize_bamboo_plans_deterministic_ordering(self):
+    def test_normalize_bamboo_plans_deterministic_ordering(self, bamboo_plans, normalized_plans):
         """Test that normalization produces consistent ordering."""
-        raw_data = get_bamboo_plans()
-        normalized1 = _normalize_bamboo_plans(raw_data)
-        normalized2 = _normalize_bamboo_plans(raw_data)
+        normalized1 = normalized_plans
+        normalized2 = _normalize_bamboo_plans(bamboo_plans)
         
         # Should have same order both times
         keys1 = [plan['key'] for plan in normalized1]
@@ -52,10 +70,10 @@ class TestBambooMockNormalization:
         expected_keys = ['PROJ-PLAN1', 'PROJ-PLAN2', 'PROJ-PLAN3']
         assert keys1 == expected_keys
     
-    def test_normalize_bamboo_plans_structure(self):
+    def test_normalize_bamboo_plans_structure(self, bamboo_plans, normalized_plans):
         """Test that normalized plans have expected structure."""
-        raw_data = get_bamboo_plans()
-        normalized = _normalize_bamboo_plans(raw_data)
+        raw_data = bamboo_plans
+        normalized = normalized_plans
         
         assert len(normalized) == 3
         
@@ -71,19 +89,20 @@ class TestBambooMockNormalization:
             assert isinstance(plan['isBuilding'], bool)
             assert isinstance(plan['averageBuildTimeInSeconds'], int)
             
-            # Check original data is preserved
-            assert '_original' in plan
-            assert isinstance(plan['_original'], dict)
+            # Original data is only carried on request
+            assert '_original' not in plan
+        
+        raw_plans = raw_data['plans']['plan']
+        with_original = _normalize_bamboo_plans(raw_data, keep_original=True)
+        assert [plan['_original'] for plan in with_original] == sorted(raw_plans, key=lambda p: p['key'])
     
-    def test_normalize_bamboo_plans_specific_content(self):
+    def test_normalize_bamboo_plans_specific_content(self, normalized_plans):
         """Test specific content of normalized plans."""
-        raw_data = get_bamboo_plans()
-        normalized = _normalize_bamboo_plans(raw_data)
-        
         # Find specific plans
-        plan1 = next(p for p in normalized if p['key'] == 'PROJ-PLAN1')
-        plan2 = next(p for p in normalized if p['key'] == 'PROJ-PLAN2')
-        plan3 = next(p for p in normalized if p['key'] == 'PROJ-PLAN3')
+        by_key = {p['key']: p for p in normalized_plans}
+        plan1 = by_key['PROJ-PLAN1']
+        plan2 = by_key['PROJ-PLAN2']
+        plan3 = by_key['PROJ-PLAN3']
         
         # Check specific attributes
         assert plan1['enabled'] is True
@@ -95,8 +114,68 @@ class TestBambooMockNormalization:
         assert plan3['enabled'] is True
         assert plan3['name'] == "Project Gamma - Integration Tests"
         assert plan3['isBuilding'] is True
-
-
+    
+    def test_get_bamboo_plans_shared_payload(self):
+        """Test that plans are shared by default and copied on request."""
+        assert get_bamboo_plans() is get_bamboo_plans()
+        
+        private = get_bamboo_plans(mutable=True)
+        assert private == get_bamboo_plans()
+        
+        private['plans']['plan'][0]['enabled'] = False
+        assert get_bamboo_plans()['plans']['plan'][0]['enabled'] is True
+    
+    def test_get_bamboo_plans_objects(self):
+        """Test that plan objects mirror the dict payload."""
+        plans = get_bamboo_plans_objects()
+        raw_plans = get_bamboo_plans()['plans']['plan']
+        
+        assert [plan.key for plan in plans] == [plan['key'] for plan in raw_plans]
+        
+        plan3 = plans[2]
+        assert plan3.name == "Project Gamma - Integration Tests"
+        assert plan3.enabled is True
+        assert plan3.is_building is True
+        assert plan3.average_build_time_seconds == 840
+        assert plan3.link == raw_plans[2]['link']['href']
+        
+        with pytest.raises(AttributeError):
+            plan3.enabled = False
+    
+    def test_plan_key_projections(self):
+        """Test plan key listings and single-plan lookup."""
+        raw_plans = get_bamboo_plans()['plans']['plan']
+        
+        assert list_plan_keys() == ('PROJ-PLAN1', 'PROJ-PLAN2', 'PROJ-PLAN3')
+        assert list_enabled_plan_keys() == ('PROJ-PLAN1', 'PROJ-PLAN3')
+        assert get_plan('PROJ-PLAN2') is raw_plans[1]
+        assert get_plan('UNKNOWN-PLAN') is None
+    
+    def test_get_plan_results(self):
+        """Test build results lookup for known and unknown plans."""
+        results = get_plan_results("PROJ-PLAN2")['results']
+        assert results['size'] == 1
+        assert results['result'][0]['buildResultKey'] == "PROJ-PLAN2-87"
+        assert results['result'][0]['state'] == "Failed"
+        
+        empty = get_plan_results("UNKNOWN-PLAN")
+        assert empty['results']['size'] == 0
+        assert len(empty['results']['result']) == 0
+        assert json.dumps(empty) == '{"results": {"size": 0, "result": []}}'
+        
+        # Results are plain JSON-serializable data, shared unless a copy is requested
+        assert json.loads(json.dumps(get_plan_results("PROJ-PLAN2"))) == get_plan_results("PROJ-PLAN2")
+        assert get_plan_results("PROJ-PLAN2") is get_plan_results("PROJ-PLAN2")
+        private = get_plan_results("PROJ-PLAN2", mutable=True)
+        private['results']['result'][0]['state'] = "Successful"
+        assert results['result'][0]['state'] == "Failed"
+        
+        # The embedded plan matches the plan listing entry and shares its values
+        plan = get_plan("PROJ-PLAN2")
+        embedded = results['result'][0]['plan']
+        assert embedded == {field: plan[field] for field in embedded}
+        assert embedded['link'] is plan['link']
+    
 class TestLogsMockService:
     """Test logs mock service functions."""
     
@@ -105,8 +184,8 @@ class TestLogsMockService:
         logs1 = get_pipeline_logs("PROJ-PLAN1")
         logs2 = get_pipeline_logs("PROJ-PLAN1")
         
-        # Should be identical
-        assert logs1 == logs2
+        # Logs for known pipelines are shared, not rebuilt per call
+        assert logs1 is logs2
         assert logs1['pipeline_key'] == "PROJ-PLAN1"
         assert logs1['total_runs'] == 3
     
@@ -174,19 +253,27 @@ class TestLogsMockService:
             assert 'runs' in logs
             assert isinstance(logs['runs'], list)
     
-    def test_get_all_logs_key_variants(self):
+    @pytest.mark.parametrize("plans", [
+        [{'key': 'PROJ-PLAN1'}],
+        [{'planKey': {'key': 'PROJ-PLAN1'}}],
+        [{'pipeline_key': 'PROJ-PLAN1'}],
+        [{'id': 'PROJ-PLAN1'}],
+        [{'key': None, 'id': 'PROJ-PLAN1'}],
+        [{'planKey': MappingProxyType({'key': 'PROJ-PLAN1'})}]
+    ])
+    def test_get_all_logs_key_variants(self, plans):
         """Test that get_all_logs handles different key field names."""
-        test_cases = [
-            [{'key': 'PROJ-PLAN1'}],
-            [{'planKey': {'key': 'PROJ-PLAN1'}}],
-            [{'pipeline_key': 'PROJ-PLAN1'}],
-            [{'id': 'PROJ-PLAN1'}]
-        ]
+        all_logs = get_all_logs(plans)
+        assert len(all_logs) == 1
+        assert all_logs[0]['pipeline_key'] == 'PROJ-PLAN1'
+    
+    def test_get_all_logs_without_key(self):
+        """Test that pipelines without a usable key get an empty log entry."""
+        all_logs = get_all_logs([{'name': 'No key'}, {'key': ''}, {'planKey': {}}])
         
-        for plans in test_cases:
-            all_logs = get_all_logs(plans)
-            assert len(all_logs) == 1
-            assert all_logs[0]['pipeline_key'] == 'PROJ-PLAN1'
+        assert [logs['pipeline_key'] for logs in all_logs] == ['UNKNOWN'] * 3
+        assert all(logs['runs'] == [] and 'error' in logs for logs in all_logs)
+        assert all_logs[0] is not all_logs[1]
     
     def test_get_error_summary_statistics(self):
         """Test error summary calculation."""
@@ -209,6 +296,7 @@ class TestLogsMockService:
         assert error_summary['success_rate'] == 50.0  # 1 success out of 2 runs
         assert error_summary['total_errors'] > 0
         assert isinstance(error_summary['error_details'], list)
+        assert json.loads(json.dumps(error_summary)) == error_summary
     
     def test_get_error_summary_no_errors(self):
         """Test error summary for pipeline with no errors."""
@@ -221,23 +309,59 @@ class TestLogsMockService:
         assert error_summary['total_errors'] == 0
         assert error_summary['error_details'] == []
     
-    def test_pipeline_specific_content(self):
+    def test_get_error_summary_cached_for_static_logs(self):
+        """Test that static logs reuse one summary while other logs are summarized afresh."""
+        logs = get_pipeline_logs("PROJ-PLAN2")
+        summary = get_error_summary(logs)
+        assert type(summary) is dict
+        assert summary == get_error_summary(logs)
+        
+        # Each call returns its own copy of the cached summary
+        summary['failed_runs'] = 0
+        assert get_error_summary(logs)['failed_runs'] == 1
+        
+        # A caller-built copy with the same key is not served from the cache
+        passing = dict(logs, runs=[dict(run, status='SUCCESS') for run in logs['runs']])
+        summary = get_error_summary(passing)
+        assert summary['pipeline_key'] == 'PROJ-PLAN2'
+        assert summary['failed_runs'] == 0
+        assert summary['error_details'] == []
+    
+    def test_iter_error_details(self):
+        """Test that streamed error details match the error summary."""
+        summary = get_error_summary(get_pipeline_logs("PROJ-PLAN3"))
+        details = list(iter_error_details("PROJ-PLAN3"))
+        
+        assert [asdict(detail) for detail in details] == summary['error_details']
+        assert details[0] == ErrorDetail(
+            run_id='run-200',
+            build_number=200,
+            step='integration-test',
+            message='Database connection timeout: Unable to connect to test database after 30 seconds',
+            timestamp='2025-09-17T08:30:20Z'
+        )
+        assert list(iter_error_details("PROJ-PLAN1")) == []
+        assert list(iter_error_details("UNKNOWN-PLAN")) == []
+    
+    def test_get_error_summary_success_rate_rounding(self):
+        """Test that the success rate is rounded to one decimal place."""
+        runs = [{'status': 'SUCCESS'}, {'status': 'SUCCESS'}, {'status': 'FAILED', 'errors': []}]
+        
+        assert get_error_summary({'runs': runs})['success_rate'] == 66.7
+        assert get_error_summary({'runs': runs[2:]})['success_rate'] == 0.0
+        assert get_error_summary({'runs': []})['success_rate'] == 0.0
+    
+    @pytest.mark.parametrize("pipeline_key, statuses, has_errors", [
+        ("PROJ-PLAN1", {'SUCCESS'}, False),  # all success
+        ("PROJ-PLAN2", {'SUCCESS', 'FAILED'}, True),  # at least one failure
+        ("PROJ-PLAN3", {'SUCCESS', 'FAILED', 'IN_PROGRESS'}, True),  # mixed states including in-progress
+    ])
+    def test_pipeline_specific_content(self, pipeline_key, statuses, has_errors):
         """Test specific content for each pipeline."""
-        # PROJ-PLAN1 should be all success
-        logs1 = get_pipeline_logs("PROJ-PLAN1")
-        assert all(run['status'] == 'SUCCESS' for run in logs1['runs'])
-        assert all(len(run['errors']) == 0 for run in logs1['runs'])
-        
-        # PROJ-PLAN2 should have at least one failure
-        logs2 = get_pipeline_logs("PROJ-PLAN2")
-        assert any(run['status'] == 'FAILED' for run in logs2['runs'])
-        assert any(len(run['errors']) > 0 for run in logs2['runs'])
-        
-        # PROJ-PLAN3 should have mixed states including in-progress
-        logs3 = get_pipeline_logs("PROJ-PLAN3")
-        statuses = [run['status'] for run in logs3['runs']]
-        assert 'IN_PROGRESS' in statuses
-        assert any(len(run['errors']) > 0 for run in logs3['runs'])
+        runs = get_pipeline_logs(pipeline_key)['runs']
+        
+        assert {run['status'] for run in runs} == statuses
+        assert any(run['errors'] for run in runs) is has_errors
     
     def test_unknown_pipeline_handling(self):
         """Test handling of unknown pipeline keys."""